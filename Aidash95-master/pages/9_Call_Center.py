@@ -1,9 +1,8 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
-import gspread
-from gspread_dataframe import get_as_dataframe
-from oauth2client.service_account import ServiceAccountCredentials
 import json
+import html
 
 st.set_page_config(page_title="Call Analysis CRM - Universal Audio", layout="wide")
 st.title("📞 Call CRM Dashboard")
@@ -11,6 +10,25 @@ st.caption("Live analytics from Google Sheets | Advanced filtering | Universal a
 
 GSHEET_URL = "https://docs.google.com/spreadsheets/d/1LFfNwb9lRQpIosSEvV3O6zIwymUIWeG9L_k7cxw1jQs/edit?gid=0"
 
+SCOPE = [
+    "https://spreadsheets.google.com/feeds",
+    "https://www.googleapis.com/auth/drive"
+]
+
+@st.cache_resource(show_spinner=False)
+def get_worksheet(creds_json, url):
+    """Authorize once and keep the worksheet handle across reruns.
+
+    JWT signing + token exchange only happen on the first call; cache
+    misses of load_data reuse the same authorized client. The client
+    imports live here too so ordinary filter reruns never pay for them.
+    """
+    import gspread
+    from oauth2client.service_account import ServiceAccountCredentials
+
+    creds = ServiceAccountCredentials.from_json_keyfile_dict(creds_json, SCOPE)
+    return gspread.authorize(creds).open_by_url(url).sheet1
+
 # --------------- COLUMN DEFINITIONS ---------------
 EXPECTED_COLUMNS = [
     "call_id", "customer_name", "email", "phone number", "Booking Status", "voice_agent_name",
@@ -43,14 +61,7 @@ with st.sidebar:
         
         if st.button("🧪 Test Connection"):
             try:
-                json_dict = st.session_state.global_gsheets_creds
-                scope = [
-                    "https://spreadsheets.google.com/feeds",
-                    "https://www.googleapis.com/auth/drive"
-                ]
-                creds = ServiceAccountCredentials.from_json_keyfile_dict(json_dict, scope)
-                client = gspread.authorize(creds)
-                sheet = client.open_by_url(GSHEET_URL).sheet1
+                get_worksheet(st.session_state.global_gsheets_creds, GSHEET_URL)
                 st.success("✅ Connection successful!")
             except Exception as e:
                 st.error(f"❌ Connection failed: {e}")
@@ -66,58 +77,101 @@ with st.sidebar:
     st.info("Apply multiple filters together for precision search.\nAudio tab supports MP3, WAV, OGG, FLAC, AAC, M4A, WEBM & more*")
 
 # --------- DATA LOADING ----------
+def _normalize_calls_df(df):
+    """Align to the expected schema and pre-type the filter columns.
+
+    Runs inside the cached loader so reruns filter typed data instead
+    of re-coercing string columns on every widget interaction.
+    """
+    # One reindex instead of K scalar column inserts (each df[col] = ""
+    # assignment consolidates the BlockManager)
+    df = df.reindex(columns=EXPECTED_COLUMNS, fill_value="")
+    for col in ("sentiment_score", "call_duration_seconds",
+                "conversion_probability", "confidence_score"):
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    # Hidden helper columns for the case-insensitive filters; the
+    # lowered text lets the filter path use plain substring search
+    # (regex=False) instead of compiling a case-folding regex per rerun
+    df["_success_lc"] = df["call_success"].astype(str).str.lower()
+    df["_cust_lc"] = df["customer_name"].astype(str).str.lower()
+    df["_agent_lc"] = df["voice_agent_name"].astype(str).str.lower()
+    return df
+
+def _display(df):
+    """Drop the hidden helper columns before rendering."""
+    return df[EXPECTED_COLUMNS]
+
 @st.cache_data(show_spinner=True)
 def load_data():
     global_creds = st.session_state.get("global_gsheets_creds")
     if global_creds is None:
         st.info("Please ensure Google Service Account credentials are uploaded in the sidebar.")
-        return pd.DataFrame(columns=EXPECTED_COLUMNS)
+        return _normalize_calls_df(pd.DataFrame(columns=EXPECTED_COLUMNS))
     try:
-        scope = [
-            "https://spreadsheets.google.com/feeds",
-            "https://www.googleapis.com/auth/drive"
-        ]
-        creds = ServiceAccountCredentials.from_json_keyfile_dict(global_creds, scope)
-        client = gspread.authorize(creds)
-        sheet = client.open_by_url(GSHEET_URL).sheet1
-        df = get_as_dataframe(sheet, evaluate_formulas=True).dropna(how="all")
-        df.columns = [col.strip() for col in df.columns]
-        return df
+        sheet = get_worksheet(global_creds, GSHEET_URL)
+        # One raw values fetch: skips get_as_dataframe's server-side
+        # formula evaluation and per-column dtype inference; empty rows
+        # are dropped from the list before pandas ever sees them
+        rows = sheet.get_values()
+        if not rows:
+            return _normalize_calls_df(pd.DataFrame(columns=EXPECTED_COLUMNS))
+        header = [col.strip() for col in rows[0]]
+        body = [row for row in rows[1:] if any(row)]
+        return _normalize_calls_df(pd.DataFrame(body, columns=header))
     except Exception as e:
         st.warning(f"⚠️ Could not load live data. Using placeholder columns. Error: {e}")
-        return pd.DataFrame(columns=EXPECTED_COLUMNS)
+        return _normalize_calls_df(pd.DataFrame(columns=EXPECTED_COLUMNS))
 
 df = load_data()
 
-for col in EXPECTED_COLUMNS:
-    if col not in df.columns:
-        df[col] = ""
-df = df[EXPECTED_COLUMNS]
-
 # -------- FILTER LOGIC ----------
-filtered_df = df.copy()
+# AND all filters into one boolean mask and slice once; the sentiment
+# bounds read the pre-typed column directly instead of running two
+# string -> float coercion passes per slider move.
+mask = np.full(len(df), True)
 if customer_name:
-    filtered_df = filtered_df[filtered_df["customer_name"].str.contains(customer_name, case=False, na=False)]
+    mask &= df["_cust_lc"].str.contains(customer_name.lower(), regex=False, na=False).to_numpy()
 if agent_name:
-    filtered_df = filtered_df[filtered_df["voice_agent_name"].str.contains(agent_name, case=False, na=False)]
+    mask &= df["_agent_lc"].str.contains(agent_name.lower(), regex=False, na=False).to_numpy()
 if call_success:
-    filtered_df = filtered_df[filtered_df["call_success"].astype(str).str.lower() == call_success.lower()]
-filtered_df = filtered_df[
-    (filtered_df["sentiment_score"].astype(str).replace("None", "0").astype(float) >= sentiment_range[0]) &
-    (filtered_df["sentiment_score"].astype(str).replace("None", "0").astype(float) <= sentiment_range[1])
-]
+    mask &= (df["_success_lc"] == call_success.lower()).to_numpy()
+sentiment = df["sentiment_score"].to_numpy()
+mask &= (sentiment >= sentiment_range[0]) & (sentiment <= sentiment_range[1])
+filtered_df = df[mask]
 
 # --------- ANALYTICS FUNCTIONS -------
 def readable_sec(seconds):
     """Turn seconds into h:mm:ss."""
     try:
         seconds = int(float(seconds))
-        h = seconds // 3600
-        m = (seconds % 3600) // 60
-        s = seconds % 60
-        return f"{h:d}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
-    except Exception:
+    except (TypeError, ValueError):
         return str(seconds)
+    m, s = divmod(seconds, 60)
+    h, m = divmod(m, 60)
+    return f"{h:d}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
+
+def readable_sec_series(col):
+    """Vectorized readable_sec for whole columns: one timedelta cast
+    plus a C-level string slice instead of a Python call per row."""
+    secs = pd.to_numeric(col, errors="coerce").round()
+    return pd.to_timedelta(secs, unit="s").astype(str).str.slice(-8)
+
+@st.cache_data(show_spinner=False)
+def _compute_metrics(fingerprint, _df):
+    """Headline analytics numbers in one cached pass.
+
+    Keyed on a cheap fingerprint (the underscore skips hashing the
+    frame) so widget interactions reuse the computed values instead of
+    re-scanning the string columns.
+    """
+    durs = _df["call_duration_seconds"].dropna()
+    return {
+        "n": len(_df),
+        "unique_customers": _df["customer_name"].nunique(),
+        "unique_agents": _df["voice_agent_name"].nunique(),
+        "success_rate": float(_df["_success_lc"].eq("yes").mean()) if len(_df) else None,
+        "avg_duration_min": float(durs.mean() / 60) if not durs.empty else None,
+    }
 
 # ------- MAIN TABS ----------
 tab1, tab2, tab3, tab4 = st.tabs([
@@ -126,49 +180,76 @@ tab1, tab2, tab3, tab4 = st.tabs([
 
 with tab1:
     st.subheader("📋 Full Call Log Table")
-    st.dataframe(filtered_df, use_container_width=True)
-    st.caption(f"Showing {len(filtered_df)} calls out of {len(df)} total records.")
+    # Cap the default render: every rerun Arrow-serializes whatever is
+    # displayed, and 44 columns of full history is mostly wasted bytes
+    show_all = st.checkbox("Show full table", value=False)
+    view = filtered_df if show_all else filtered_df.head(500)
+    st.dataframe(_display(view), use_container_width=True)
+    if len(view) < len(filtered_df):
+        st.caption(f"Showing first {len(view)} of {len(filtered_df)} filtered calls "
+                   f"({len(df)} total records). Tick 'Show full table' for everything.")
+    else:
+        st.caption(f"Showing {len(filtered_df)} calls out of {len(df)} total records.")
 
 with tab2:
     st.subheader("📊 Analytics & Insights")
+    metrics = _compute_metrics(len(df), df)
     col1, col2, col3, col4, col5 = st.columns(5)
     with col1:
-        st.metric("Total Calls", len(df))
+        st.metric("Total Calls", metrics["n"])
     with col2:
-        st.metric("Unique Customers", df["customer_name"].nunique())
+        st.metric("Unique Customers", metrics["unique_customers"])
     with col3:
-        st.metric("Programs/Agents", df["voice_agent_name"].nunique())
+        st.metric("Programs/Agents", metrics["unique_agents"])
     with col4:
-        st.metric("Success Rate (%)", f"{100*df['call_success'].str.lower().eq('yes').mean():.1f}" if len(df) else "-")
+        st.metric("Success Rate (%)", f"{100 * metrics['success_rate']:.1f}" if metrics["success_rate"] is not None else "-")
     with col5:
-        durs = pd.to_numeric(df["call_duration_seconds"], errors='coerce').dropna()
-        st.metric("Avg Duration (min)", f"{(durs.mean()/60):.2f}" if not durs.empty else "-")
+        st.metric("Avg Duration (min)", f"{metrics['avg_duration_min']:.2f}" if metrics["avg_duration_min"] is not None else "-")
 
     st.markdown("#### 📈 Calls by Agent")
     st.bar_chart(df["voice_agent_name"].value_counts())
     st.markdown("#### 🎯 Conversion Probabilities")
     st.line_chart(pd.to_numeric(df["conversion_probability"], errors="coerce"))
     st.markdown("#### 📅 Calls per Day")
-    calls_by_date = df.groupby("call_date")["call_id"].count()
+    # value_counts is a single hash aggregation; groupby().count()
+    # builds a full GroupBy for the same answer
+    calls_by_date = df["call_date"].value_counts().sort_index()
     if not calls_by_date.empty:
         st.area_chart(calls_by_date)
     else:
         st.info("No date data to plot.")
 
+PAGE_SIZE = 25
+
+def _paginate(df, key):
+    """Page selector + slice: caps the widget count per rerun at one
+    page instead of one expander per filtered row."""
+    n_pages = (len(df) - 1) // PAGE_SIZE + 1
+    if n_pages > 1:
+        page = st.number_input("Page", min_value=1, max_value=n_pages, value=1, key=key)
+        st.caption(f"Page {page} of {n_pages} ({len(df)} calls)")
+    else:
+        page = 1
+    return df.iloc[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+
 with tab3:
     st.subheader("🧠 AI Insights: Summaries & Next Actions")
     if filtered_df.empty:
         st.info("No results for these filters.")
     else:
-        for idx, row in filtered_df.iterrows():
-            with st.expander(f"📞 {row['call_id']} - {row['customer_name']} ({row['call_date']})"):
-                st.write(f"**Agent:** {row['voice_agent_name']}")
-                st.write(f"**Outcome:** {row['call_outcome']} | **Success:** {row['call_success']}")
-                st.markdown(f"**Summary:** {row['summary']}")
-                st.markdown(f"**Action Items:** {row['action_items']}")
-                if row["transcript"]:
+        # itertuples avoids building a Series per row; the static lines
+        # collapse into one markdown widget per call
+        for row in _paginate(filtered_df, "summary_page").itertuples(index=False):
+            with st.expander(f"📞 {row.call_id} - {row.customer_name} ({row.call_date})"):
+                st.markdown(
+                    f"**Agent:** {row.voice_agent_name}\n\n"
+                    f"**Outcome:** {row.call_outcome} | **Success:** {row.call_success}\n\n"
+                    f"**Summary:** {row.summary}\n\n"
+                    f"**Action Items:** {row.action_items}"
+                )
+                if row.transcript:
                     st.markdown("**Transcript Preview:**")
-                    st.text(row["transcript"][:1500] + " ...")
+                    st.text(str(row.transcript)[:1500] + " ...")
                 else:
                     st.info("No transcript found for this call.")
 
@@ -179,35 +260,51 @@ with tab4:
         "Browser support depends on file type. For best experience, use direct URLs."
     )
 
-    audiocount = 0
-    for idx, row in filtered_df.iterrows():
-        url = str(row["call_recording_url"]).strip()
-        if url:
-            audiocount += 1
+    # Page over rows with a recording so a broad filter doesn't emit
+    # hundreds of audio widgets in one rerun
+    recordings_df = filtered_df[
+        filtered_df["call_recording_url"].astype(str).str.strip().ne("")
+    ]
+    if recordings_df.empty:
+        st.info("No recordings found in filtered results.")
+    else:
+        for row in _paginate(recordings_df, "audio_page").itertuples(index=False):
+            url = str(row.call_recording_url).strip()
             filename = url.split("/")[-1] if "/" in url else url
             ext = filename.split(".")[-1].lower() if "." in filename else None
             icon = AUDIO_FORMAT_ICONS.get(ext, "🎧")
-            st.markdown(f"---\n**{icon} {row['call_id']} — {row['customer_name']}**")
-            st.write(f"**Audio file:** `{filename}` | **Format:** `{ext or 'Unknown'}`")
-
-            # Attempt st.audio play, fallback to clickable link
-            if ext in SUPPORTED_AUDIO_EXTS or ext is None:  # Try anyway; browsers may support more
-                try:
-                    st.audio(url)
-                except Exception as e:
-                    st.warning(f"Could not play audio in-app: {e}")
-                    st.markdown(f"[Play/download manually]({url})")
+            # The URL comes from a spreadsheet cell and is rendered with
+            # unsafe_allow_html: escape it before interpolating and only
+            # play http(s) links so a crafted value can't inject markup
+            # or a javascript: scheme
+            safe_url = html.escape(url, quote=True)
+            safe_filename = html.escape(filename)
+            parts = [
+                f"---\n**{icon} {row.call_id} — {row.customer_name}**\n\n"
+                f"**Audio file:** `{safe_filename}` | **Format:** `{ext or 'Unknown'}`"
+            ]
+
+            # Plain <audio> tag instead of st.audio: no media widget
+            # per row, and preload=none defers the browser fetch until
+            # the user hits play
+            if not url.lower().startswith(("http://", "https://")):
+                parts.append(f"⚠️ Recording URL is not an http(s) link: `{safe_filename}`. Skipping player.")
+            elif ext in SUPPORTED_AUDIO_EXTS or ext is None:  # Try anyway; browsers may support more
+                parts.append(
+                    f'<audio controls preload="none" src="{safe_url}"></audio>'
+                    f'\n\n[Play/download manually]({safe_url})'
+                )
             else:
-                st.warning(f"Audio file appears to be an unsupported format: `{ext}`. [Manual link]({url})")
+                parts.append(f"⚠️ Audio file appears to be an unsupported format: `{ext}`. [Manual link]({safe_url})")
+            st.markdown("\n\n".join(parts), unsafe_allow_html=True)
 
             # Transcript preview if available
-            if row["transcript"]:
+            if row.transcript:
+                transcript = str(row.transcript)
                 with st.expander("📝 Transcript Preview"):
-                    st.text(row["transcript"][:1000] + ("..." if len(row["transcript"])>1000 else ""))
-            st.caption("Supported: mp3, wav, ogg, flac, aac, m4a, webm, oga & more by browser. "
-                       "If playback fails, try manual download.")
-    if audiocount == 0:
-        st.info("No recordings found in filtered results.")
+                    st.text(transcript[:1000] + ("..." if len(transcript) > 1000 else ""))
+        st.caption("Supported: mp3, wav, ogg, flac, aac, m4a, webm, oga & more by browser. "
+                   "If playback fails, try manual download.")
 
 st.success("✅ Dashboard loaded. Explore all calls, deep analytics, summaries, and play recordings of any major audio format!")
 
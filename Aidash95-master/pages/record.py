@@ -7,15 +7,14 @@ import time
 from datetime import datetime
 import re
 import io
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
-import ebooklib
-from ebooklib import epub
+import threading
+import queue
+import collections
 import tempfile
+import types
+import functools
+import string
+import ssl
 import os
 import traceback
 from typing import Dict, List, Tuple, Any, Optional
@@ -62,8 +61,213 @@ except ImportError:
     
     rate_limiter = RateLimiter()
 
-# Configuration - 10 Different Webhook Endpoints
-WEBHOOK_URLS = {
+# Shared HTTP session: every webhook endpoint lives on the same host,
+# so one pooled keep-alive connection (with adapter-level retries on
+# transient gateway errors) serves all sends without a fresh TCP+TLS
+# handshake per call.
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+class _TLSAdapter(HTTPAdapter):
+    """HTTPAdapter pinned to one shared SSLContext.
+
+    urllib3 otherwise builds a fresh context per pool, so every pooled
+    connection that churns under bursts pays a full handshake; a single
+    context keeps OpenSSL's session cache warm and lets reconnects
+    resume the TLS session instead."""
+
+    def __init__(self, ssl_context=None, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self._ssl_context is not None:
+            kwargs['ssl_context'] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.options |= ssl.OP_NO_COMPRESSION
+
+_SESSION = requests.Session()
+_SESSION.mount('https://', _TLSAdapter(
+    ssl_context=_SSL_CONTEXT,
+    pool_connections=10,
+    pool_maxsize=100,
+    max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[502, 503, 504])
+))
+
+class _TokenBucket:
+    """Thread-safe token bucket bounding global outbound request rate.
+
+    rate_limiter only gates per user+type; this caps total RPS to the
+    webhook host across concurrent fan-out workers so ticking many
+    content types cannot trigger a 429 storm from the server."""
+
+    def __init__(self, max_rate=50, time_period=1.0):
+        self.capacity = float(max_rate)
+        self.fill_rate = max_rate / time_period
+        self.tokens = float(max_rate)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.fill_rate
+            time.sleep(wait)
+
+_OUTBOUND_BUCKET = _TokenBucket(max_rate=50, time_period=1.0)
+
+# Audio payloads whose base64 body exceeds this go as multipart uploads
+# (raw bytes in a spooled temp file) instead of base64-in-JSON
+_MULTIPART_THRESHOLD = 1024 * 1024
+
+# Background dispatch: single sends are queued to a daemon worker so the
+# script run returns at enqueue cost instead of blocking up to the full
+# request timeout. The queue and worker are process-wide, but every
+# task closes over its own session's dispatch_results deque (created in
+# initialize_session_state), so one browser session's outcomes never
+# land in another's history/stats. Workers never touch session_state;
+# deque append/popleft are atomic, so the handoff needs no lock.
+_DISPATCH_QUEUE = queue.Queue()
+_dispatch_thread = None
+_dispatch_thread_lock = threading.Lock()
+
+# Batching: payloads accumulate per webhook type and go out as one
+# {"batch": [...]} POST, so N recordings cost one TCP round trip instead
+# of N. The accumulator is session-scoped - batches from different
+# browser sessions must never merge into one POST under one X-User-ID -
+# and only touched on the script thread, so it needs no lock. A batch
+# flushes when it reaches webhook_batch_size records or on the first
+# rerun after _BATCH_MAX_AGE seconds, whichever comes first.
+_BATCH_MAX_AGE = 2.0
+
+def _flush_one_batch(webhook_type):
+    items = st.session_state.webhook_batch.pop(webhook_type, [])
+    meta = st.session_state.webhook_batch_meta.pop(webhook_type, None)
+    if not items or meta is None:
+        return
+    if len(items) == 1:
+        body = _json_dumps(items[0])
+    else:
+        body = _json_dumps({'batch': items, 'count': len(items)})
+    headers = {
+        **_BASE_HEADERS[webhook_type],
+        'X-Payload-Size': str(len(body)),
+        'X-User-ID': meta['user_id'],
+        'X-Batch-Count': str(len(items))
+    }
+    _DISPATCH_QUEUE.put((webhook_type, meta['url'], body, headers, len(body),
+                         st.session_state.dispatch_results))
+
+def flush_batch(webhook_type=None):
+    """Flush this session's pending batches (all types when none given)."""
+    targets = [webhook_type] if webhook_type else list(st.session_state.webhook_batch)
+    for wt in targets:
+        _flush_one_batch(wt)
+
+def _flush_stale_batches():
+    now = time.monotonic()
+    meta_map = st.session_state.webhook_batch_meta
+    for wt in list(st.session_state.webhook_batch):
+        meta = meta_map.get(wt)
+        if meta and now - meta['first_at'] >= _BATCH_MAX_AGE:
+            _flush_one_batch(wt)
+
+def _dispatch_worker():
+    while True:
+        task = _DISPATCH_QUEUE.get()
+        webhook_type, url, body, headers, payload_size, results = task
+        try:
+            _OUTBOUND_BUCKET.acquire()
+            if isinstance(body, tuple) and body[0] == 'multipart':
+                _, audio_file, meta_json = body
+                # Let requests set the multipart boundary Content-Type
+                headers = {k: v for k, v in headers.items() if k != 'Content-Type'}
+                try:
+                    response = _SESSION.post(
+                        url,
+                        files={'audio': ('clip.webm', audio_file, 'audio/webm')},
+                        data={'metadata': meta_json},
+                        headers=headers, timeout=(5, 30), verify=True
+                    )
+                finally:
+                    audio_file.close()
+            else:
+                response = _SESSION.post(url, data=body, headers=headers,
+                                         timeout=(5, 30), verify=True)
+            results.append({
+                'timestamp': datetime.now().isoformat(),
+                'webhook_type': webhook_type,
+                'status_code': response.status_code,
+                'success': response.status_code == 200,
+                'payload_size': payload_size,
+                'response_text': response.content[:500].decode('utf-8', 'replace') or None,
+                'url': url,
+                'attempt_count': 1,  # adapter-level retries are transparent
+                'validation_passed': True
+            })
+        except Exception as exc:
+            log_webhook_error(webhook_type, exc)
+            results.append({
+                'error': type(exc).__name__,
+                'timestamp': datetime.now().isoformat(),
+                'webhook_type': webhook_type,
+                'url': url,
+                'success': False,
+                'exception_message': str(exc)
+            })
+        finally:
+            _DISPATCH_QUEUE.task_done()
+
+def _ensure_dispatch_worker():
+    global _dispatch_thread
+    with _dispatch_thread_lock:
+        if _dispatch_thread is None or not _dispatch_thread.is_alive():
+            _dispatch_thread = threading.Thread(target=_dispatch_worker, daemon=True)
+            _dispatch_thread.start()
+
+def _drain_dispatch_results():
+    """Apply this session's completed background sends to history/stats.
+
+    Runs on the script thread only; called at the top of each run and
+    right before new sends are queued. Also the stale-batch tick: with
+    the accumulator session-scoped, age-based flushes happen here
+    instead of on the worker thread."""
+    _flush_stale_batches()
+    stats_map = st.session_state.webhook_stats
+    results = st.session_state.dispatch_results
+    while results:
+        data = results.popleft()
+        st.session_state.webhook_responses.appendleft(data)
+        webhook_type = data.get('webhook_type')
+        if webhook_type in stats_map:
+            key = 'success' if data.get('success') else 'errors'
+            stats_map[webhook_type][key] += 1
+
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        """Encode a payload to JSON bytes with orjson (several times
+        faster on large transcripts/audio payloads)."""
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_dumps(obj):
+        """Stdlib fallback when orjson is not installed."""
+        return json.dumps(obj).encode('utf-8')
+
+# Configuration - 10 Different Webhook Endpoints. Frozen read-only:
+# per-session copies live in st.session_state.webhook_urls, and the
+# proxy catches accidental writes to the shared module-level table.
+WEBHOOK_URLS = types.MappingProxyType({
     'audio': 'https://agentonline-u29564.vm.elestio.app/webhook-test/audio-files',
     'books': 'https://agentonline-u29564.vm.elestio.app/webhook-test/books-content',
     'lectures': 'https://agentonline-u29564.vm.elestio.app/webhook-test/lectures-education',
@@ -74,10 +278,10 @@ WEBHOOK_URLS = {
     'images': 'https://agentonline-u29564.vm.elestio.app/webhook-test/images-photos',
     'research': 'https://agentonline-u29564.vm.elestio.app/webhook-test/research-data',
     'meetings': 'https://agentonline-u29564.vm.elestio.app/webhook-test/meetings-records'
-}
+})
 
 # Content type configurations
-CONTENT_TYPES = {
+_CONTENT_TYPES_RAW = {
     'audio': {
         'name': '🎵 Audio Files',
         'description': 'Voice recordings, music files, audio memos',
@@ -150,6 +354,55 @@ CONTENT_TYPES = {
     }
 }
 
+# Frozen view shared by every session: immutable inner mappings and
+# tuple field lists, so nothing needs defensive copies
+CONTENT_TYPES = types.MappingProxyType({
+    key: types.MappingProxyType({**value, 'fields': tuple(value['fields'])})
+    for key, value in _CONTENT_TYPES_RAW.items()
+})
+
+# Type-specific payload fields as (field, default) pairs, consumed by
+# create_payload_for_webhook_type instead of a ten-branch if/elif.
+# List-valued defaults are tuples so the shared table stays immutable
+# (both JSON encoders emit them as arrays).
+_TYPE_FIELD_DEFAULTS = {
+    'audio': (('format', 'webm'), ('duration', 0), ('sample_rate', 44100)),
+    'books': (('author', ''), ('genre', ''), ('chapter', ''), ('page_count', 0)),
+    'lectures': (('instructor', ''), ('subject', ''), ('course_code', ''), ('slides_count', 0)),
+    'podcasts': (('host', ''), ('episode_number', ''), ('show_name', ''), ('guest', '')),
+    'notes': (('tags', ()), ('priority', 'medium'), ('category', 'general'), ('reminder_date', '')),
+    'documents': (('document_type', ''), ('version', '1.0'), ('department', ''), ('classification', 'public')),
+    'videos': (('resolution', '1080p'), ('format', 'mp4'), ('fps', 30), ('codec', 'h264')),
+    'images': (('dimensions', ''), ('format', 'jpg'), ('location', ''), ('camera_info', '')),
+    'research': (('methodology', ''), ('subject_area', ''), ('institution', ''), ('funding_source', '')),
+    'meetings': (('participants', ()), ('agenda_items', ()), ('action_items', ()), ('meeting_type', 'general'))
+}
+
+# Static header parts built once at import; per-send values
+# (X-Payload-Size, X-User-ID) are merged in at call time
+_BASE_HEADERS = {
+    webhook_type: {
+        'Content-Type': 'application/json',
+        'User-Agent': f'Book-Buddy-Multi-Webhook/2.0.0-{webhook_type}',
+        'X-Webhook-Type': webhook_type,
+        'X-Content-Type': webhook_type
+    }
+    for webhook_type in WEBHOOK_URLS
+}
+
+# Selector display strings built once at import; the selectboxes take the
+# type keys directly with a format_func, so no per-rerun label rebuilding
+# and no reverse .index() lookup to recover the chosen key
+_CT_KEYS = tuple(CONTENT_TYPES)
+_CT_OPTION_LABELS = {
+    key: f"{config['icon']} {config['name']} - {config['description']}"
+    for key, config in CONTENT_TYPES.items()
+}
+_CT_SHORT_LABELS = {
+    key: f"{config['icon']} {config['name']}"
+    for key, config in CONTENT_TYPES.items()
+}
+
 # Page configuration
 st.set_page_config(
     page_title="🎙️ Book Buddy - Multi-Webhook Edition", 
@@ -273,20 +526,29 @@ def initialize_session_state():
     """Initialize all session state variables with enhanced webhook support"""
     defaults = {
         'selected_webhook_type': 'audio',
-        'webhook_urls': WEBHOOK_URLS.copy(),
+        'webhook_urls': dict(WEBHOOK_URLS),
         'recording_title': '',
         'recording_description': '',
         'user_name': 'Multi-Webhook User',
         'content_metadata': {},
         'content': '',
-        'webhook_responses': [],
+        # Bounded deque: appendleft + maxlen replaces the old
+        # insert(0) + [:20] slice (which copied the list per send)
+        'webhook_responses': collections.deque(maxlen=20),
         'last_recording': None,
         'audio_quality': 'High',
         'auto_send': True,
         'show_advanced': False,
         'webhook_stats': {webhook_type: {'sent': 0, 'success': 0, 'errors': 0} for webhook_type in WEBHOOK_URLS.keys()},
         'batch_mode': False,
-        'selected_webhooks': []
+        'selected_webhooks': [],
+        'webhook_batch_size': 10,
+        # Session-owned dispatch state: the worker appends outcomes to
+        # this deque (closed over in each queued task) and the batch
+        # accumulator never mixes payloads across browser sessions
+        'dispatch_results': collections.deque(),
+        'webhook_batch': {},
+        'webhook_batch_meta': {}
     }
     
     for key, value in defaults.items():
@@ -294,25 +556,24 @@ def initialize_session_state():
             st.session_state[key] = value
 
 # Utility functions
+_URL_RE = re.compile(r'^https?://[^/\s]+(/\S*)?$')
+
+@functools.lru_cache(maxsize=64)
 def validate_webhook_url(url):
-    """Validate webhook URL format"""
-    try:
-        import urllib.parse
-        result = urllib.parse.urlparse(url)
-        return all([result.scheme, result.netloc])
-    except:
-        return False
+    """Validate webhook URL format.
+
+    Memoized: the page re-checks the same handful of configured URLs on
+    every rerun, so repeat calls are a cache lookup instead of a parse."""
+    return bool(_URL_RE.match(url or ''))
 
 def format_file_size(size_bytes):
     """Format file size in human readable format"""
     if size_bytes == 0:
         return "0 B"
-    size_names = ["B", "KB", "MB", "GB"]
-    import math
-    i = int(math.floor(math.log(size_bytes, 1024)))
-    p = math.pow(1024, i)
-    s = round(size_bytes / p, 2)
-    return f"{s} {size_names[i]}"
+    # bit_length picks the 1024-unit directly - no float log calls
+    i = min((int(size_bytes).bit_length() - 1) // 10, 3)
+    s = round(size_bytes / (1 << (10 * i)), 2)
+    return f"{s} {['B', 'KB', 'MB', 'GB'][i]}"
 
 def create_payload_for_webhook_type(webhook_type, content_data, metadata):
     """Create type-specific payload for different webhook types"""
@@ -333,86 +594,20 @@ def create_payload_for_webhook_type(webhook_type, content_data, metadata):
         }
     }
     
-    # Add type-specific fields
-    type_specific = {}
-    
-    if webhook_type == 'audio':
-        type_specific.update({
-            'format': metadata.get('format', 'webm'),
-            'duration': metadata.get('duration', 0),
-            'sample_rate': metadata.get('sample_rate', 44100)
-        })
-    elif webhook_type == 'books':
-        type_specific.update({
-            'author': metadata.get('author', ''),
-            'genre': metadata.get('genre', ''),
-            'chapter': metadata.get('chapter', ''),
-            'page_count': metadata.get('page_count', 0)
-        })
-    elif webhook_type == 'lectures':
-        type_specific.update({
-            'instructor': metadata.get('instructor', ''),
-            'subject': metadata.get('subject', ''),
-            'course_code': metadata.get('course_code', ''),
-            'slides_count': metadata.get('slides_count', 0)
-        })
-    elif webhook_type == 'podcasts':
-        type_specific.update({
-            'host': metadata.get('host', ''),
-            'episode_number': metadata.get('episode_number', ''),
-            'show_name': metadata.get('show_name', ''),
-            'guest': metadata.get('guest', '')
-        })
-    elif webhook_type == 'notes':
-        type_specific.update({
-            'tags': metadata.get('tags', []),
-            'priority': metadata.get('priority', 'medium'),
-            'category': metadata.get('category', 'general'),
-            'reminder_date': metadata.get('reminder_date', '')
-        })
-    elif webhook_type == 'documents':
-        type_specific.update({
-            'document_type': metadata.get('document_type', ''),
-            'version': metadata.get('version', '1.0'),
-            'department': metadata.get('department', ''),
-            'classification': metadata.get('classification', 'public')
-        })
-    elif webhook_type == 'videos':
-        type_specific.update({
-            'resolution': metadata.get('resolution', '1080p'),
-            'format': metadata.get('format', 'mp4'),
-            'fps': metadata.get('fps', 30),
-            'codec': metadata.get('codec', 'h264')
-        })
-    elif webhook_type == 'images':
-        type_specific.update({
-            'dimensions': metadata.get('dimensions', ''),
-            'format': metadata.get('format', 'jpg'),
-            'location': metadata.get('location', ''),
-            'camera_info': metadata.get('camera_info', '')
-        })
-    elif webhook_type == 'research':
-        type_specific.update({
-            'methodology': metadata.get('methodology', ''),
-            'subject_area': metadata.get('subject_area', ''),
-            'institution': metadata.get('institution', ''),
-            'funding_source': metadata.get('funding_source', '')
-        })
-    elif webhook_type == 'meetings':
-        type_specific.update({
-            'participants': metadata.get('participants', []),
-            'agenda_items': metadata.get('agenda_items', []),
-            'action_items': metadata.get('action_items', []),
-            'meeting_type': metadata.get('meeting_type', 'general')
-        })
-    
-    base_payload['content']['type_specific_fields'] = type_specific
+    # Add type-specific fields from the module-level table
+    base_payload['content']['type_specific_fields'] = {
+        field: metadata.get(field, default)
+        for field, default in _TYPE_FIELD_DEFAULTS.get(webhook_type, ())
+    }
     return base_payload
 
 def send_to_webhook(payload, webhook_type=None):
     """Enhanced webhook sending with comprehensive error handling and validation"""
     webhook_type = webhook_type or st.session_state.selected_webhook_type
     url = st.session_state.webhook_urls[webhook_type]
+    # One session_state proxy lookup per send; the inner dict is plain
+    # and mutates in place
+    stats = st.session_state.webhook_stats[webhook_type]
     
     try:
         # Rate limiting check
@@ -421,93 +616,104 @@ def send_to_webhook(payload, webhook_type=None):
         if not rate_ok:
             raise RateLimitError(rate_msg)
         
+        # Fail fast on oversized payloads: the 10MB JSON cap is checked
+        # before the O(payload) validation and sanitizer passes, so a
+        # huge blob skips both. Large audio clips are exempt - they
+        # leave as multipart rather than JSON.
+        content = payload.get('content') or {}
+        primary = content.get('primary_data')
+        use_multipart = (webhook_type == 'audio'
+                         and isinstance(primary, str)
+                         and len(primary) > _MULTIPART_THRESHOLD)
+        body = None
+        if not use_multipart:
+            body = _json_dumps(payload)
+            payload_size = len(body)
+            if payload_size > 10 * 1024 * 1024:
+                raise PayloadTooLargeError(f"Payload too large: {format_file_size(payload_size)} (max 10MB)")
+
         # Payload validation
         is_valid, validation_errors = WebhookValidator.validate_webhook_payload(payload)
         if not is_valid:
             raise ValidationError(validation_errors)
-        
-        # Sanitize payload
-        payload = WebhookValidator.sanitize_payload(payload)
-        
-        # Check payload size
-        payload_json = json.dumps(payload)
-        payload_size = len(payload_json.encode('utf-8'))
-        
-        # 10MB limit for payload
-        if payload_size > 10 * 1024 * 1024:
-            raise PayloadTooLargeError(f"Payload too large: {format_file_size(payload_size)} (max 10MB)")
+
+        # Sanitize payload; re-dump only if the sanitizer actually
+        # replaced the object
+        sanitized = WebhookValidator.sanitize_payload(payload)
+        if sanitized is not payload and not use_multipart:
+            body = _json_dumps(sanitized)
+            payload_size = len(body)
+            if payload_size > 10 * 1024 * 1024:
+                raise PayloadTooLargeError(f"Payload too large: {format_file_size(payload_size)} (max 10MB)")
+        payload = sanitized
+
+        # Large audio clips go out as multipart instead of
+        # base64-in-JSON: the wire payload shrinks by the ~33% base64
+        # overhead and the blob never passes through a JSON dumps
+        # buffer, which also lifts the practical size ceiling
+        multipart = None
+        if use_multipart:
+            content = payload.get('content') or {}
+            try:
+                audio_bytes = base64.b64decode(content.get('primary_data'))
+            except Exception:
+                audio_bytes = b''
+            if audio_bytes:
+                spooled = tempfile.SpooledTemporaryFile(max_size=5 * 1024 * 1024)
+                spooled.write(audio_bytes)
+                spooled.seek(0)
+                meta = dict(payload)
+                meta['content'] = {k: v for k, v in content.items() if k != 'primary_data'}
+                multipart = ('multipart', spooled, _json_dumps(meta))
+                payload_size = len(audio_bytes)
+                body = multipart
+            else:
+                # Undecodable base64 falls back to the JSON path
+                body = _json_dumps(payload)
+                payload_size = len(body)
+                if payload_size > 10 * 1024 * 1024:
+                    raise PayloadTooLargeError(f"Payload too large: {format_file_size(payload_size)} (max 10MB)")
         
         headers = {
-            'Content-Type': 'application/json',
-            'User-Agent': f'Book-Buddy-Multi-Webhook/2.0.0-{webhook_type}',
-            'X-Webhook-Type': webhook_type,
-            'X-Content-Type': webhook_type,
+            **_BASE_HEADERS[webhook_type],
             'X-Payload-Size': str(payload_size),
             'X-User-ID': user_id
         }
-        
+
         # Update stats
-        st.session_state.webhook_stats[webhook_type]['sent'] += 1
-        
-        # Send request with retry logic
-        max_retries = 3
-        retry_delay = 1
-        
-        for attempt in range(max_retries):
-            try:
-                response = requests.post(
-                    url, 
-                    json=payload, 
-                    headers=headers, 
-                    timeout=30,
-                    verify=True  # SSL verification
-                )
-                break
-            except requests.exceptions.Timeout:
-                if attempt == max_retries - 1:
-                    raise
-                time.sleep(retry_delay * (attempt + 1))
-            except requests.exceptions.ConnectionError:
-                if attempt == max_retries - 1:
-                    raise
-                time.sleep(retry_delay * (attempt + 1))
-        
-        # Store response in session state
-        response_data = {
+        stats['sent'] += 1
+
+        # Hand the request to the background worker; the delivery
+        # outcome is drained into history/stats on the next rerun
+        _drain_dispatch_results()
+        _ensure_dispatch_worker()
+        batch_size = int(st.session_state.get('webhook_batch_size', 10) or 1)
+        if batch_size > 1 and multipart is None:
+            meta_map = st.session_state.webhook_batch_meta
+            if webhook_type not in meta_map:
+                meta_map[webhook_type] = {
+                    'url': url,
+                    'user_id': user_id,
+                    'first_at': time.monotonic()
+                }
+            batch = st.session_state.webhook_batch.setdefault(webhook_type, [])
+            batch.append(payload)
+            if len(batch) >= batch_size:
+                _flush_one_batch(webhook_type)
+        else:
+            _DISPATCH_QUEUE.put((webhook_type, url, body, headers, payload_size,
+                                 st.session_state.dispatch_results))
+
+        queued_data = {
             'timestamp': datetime.now().isoformat(),
             'webhook_type': webhook_type,
-            'status_code': response.status_code,
-            'success': response.status_code == 200,
+            'queued': True,
             'payload_size': payload_size,
-            'response_text': response.text[:500] if response.text else None,
             'url': url,
-            'attempt_count': attempt + 1,
             'validation_passed': True
         }
-        
-        st.session_state.webhook_responses.insert(0, response_data)
-        # Keep only last 20 responses
-        st.session_state.webhook_responses = st.session_state.webhook_responses[:20]
-        
-        if response.status_code == 200:
-            st.session_state.webhook_stats[webhook_type]['success'] += 1
-            return True, f"✅ Successfully sent to {CONTENT_TYPES[webhook_type]['name']} webhook!", response_data
-        elif response.status_code == 429:
-            # Rate limited by server
-            st.session_state.webhook_stats[webhook_type]['errors'] += 1
-            return False, f"⚠️ Rate limited by server. Please try again later.", response_data
-        elif response.status_code >= 500:
-            # Server error
-            st.session_state.webhook_stats[webhook_type]['errors'] += 1
-            return False, f"🔧 Server error ({response.status_code}). Please try again later.", response_data
-        elif response.status_code >= 400:
-            # Client error
-            st.session_state.webhook_stats[webhook_type]['errors'] += 1
-            return False, f"❌ Request error ({response.status_code}): {response.text[:100]}", response_data
-        else:
-            st.session_state.webhook_stats[webhook_type]['errors'] += 1
-            return False, f"⚠️ Unexpected response ({response.status_code})", response_data
-            
+        return True, f"📬 Queued for {CONTENT_TYPES[webhook_type]['name']} webhook — delivering in the background", queued_data
+
     except ValidationError as e:
         error_data = {
             'error': 'Validation failed',
@@ -517,8 +723,8 @@ def send_to_webhook(payload, webhook_type=None):
             'validation_errors': e.errors if hasattr(e, 'errors') else [str(e)],
             'validation_passed': False
         }
-        st.session_state.webhook_responses.insert(0, error_data)
-        st.session_state.webhook_stats[webhook_type]['errors'] += 1
+        st.session_state.webhook_responses.appendleft(error_data)
+        stats['errors'] += 1
         log_webhook_error(webhook_type, e)
         return False, f"❌ Validation failed: {str(e)[:100]}...", error_data
         
@@ -530,8 +736,8 @@ def send_to_webhook(payload, webhook_type=None):
             'url': url,
             'payload_size': payload_size if 'payload_size' in locals() else 0
         }
-        st.session_state.webhook_responses.insert(0, error_data)
-        st.session_state.webhook_stats[webhook_type]['errors'] += 1
+        st.session_state.webhook_responses.appendleft(error_data)
+        stats['errors'] += 1
         log_webhook_error(webhook_type, e, payload_size if 'payload_size' in locals() else 0)
         return False, f"📦 {str(e)}", error_data
         
@@ -542,50 +748,11 @@ def send_to_webhook(payload, webhook_type=None):
             'webhook_type': webhook_type,
             'url': url
         }
-        st.session_state.webhook_responses.insert(0, error_data)
-        st.session_state.webhook_stats[webhook_type]['errors'] += 1
+        st.session_state.webhook_responses.appendleft(error_data)
+        stats['errors'] += 1
         log_webhook_error(webhook_type, e)
         return False, f"🚦 {str(e)}", error_data
         
-    except requests.exceptions.Timeout:
-        error_data = {
-            'error': 'Request timeout', 
-            'timestamp': datetime.now().isoformat(),
-            'webhook_type': webhook_type,
-            'url': url,
-            'timeout_duration': 30
-        }
-        st.session_state.webhook_responses.insert(0, error_data)
-        st.session_state.webhook_stats[webhook_type]['errors'] += 1
-        log_webhook_error(webhook_type, requests.exceptions.Timeout("Request timeout"))
-        return False, "⏱️ Request timed out after 30 seconds. Please check your connection.", error_data
-        
-    except requests.exceptions.ConnectionError as e:
-        error_data = {
-            'error': 'Connection error', 
-            'timestamp': datetime.now().isoformat(),
-            'webhook_type': webhook_type,
-            'url': url,
-            'connection_error': str(e)
-        }
-        st.session_state.webhook_responses.insert(0, error_data)
-        st.session_state.webhook_stats[webhook_type]['errors'] += 1
-        log_webhook_error(webhook_type, e)
-        return False, "🔌 Could not connect to webhook. Please check the URL and your internet connection.", error_data
-        
-    except requests.exceptions.SSLError as e:
-        error_data = {
-            'error': 'SSL certificate error', 
-            'timestamp': datetime.now().isoformat(),
-            'webhook_type': webhook_type,
-            'url': url,
-            'ssl_error': str(e)
-        }
-        st.session_state.webhook_responses.insert(0, error_data)
-        st.session_state.webhook_stats[webhook_type]['errors'] += 1
-        log_webhook_error(webhook_type, e)
-        return False, "🔒 SSL certificate error. Please check the webhook URL.", error_data
-        
     except json.JSONEncodeError as e:
         error_data = {
             'error': 'JSON encoding error', 
@@ -594,8 +761,8 @@ def send_to_webhook(payload, webhook_type=None):
             'url': url,
             'json_error': str(e)
         }
-        st.session_state.webhook_responses.insert(0, error_data)
-        st.session_state.webhook_stats[webhook_type]['errors'] += 1
+        st.session_state.webhook_responses.appendleft(error_data)
+        stats['errors'] += 1
         log_webhook_error(webhook_type, e)
         return False, "📄 Failed to encode payload as JSON. Please check your data.", error_data
         
@@ -606,21 +773,71 @@ def send_to_webhook(payload, webhook_type=None):
             'webhook_type': webhook_type,
             'url': url,
             'exception_type': type(e).__name__,
-            'exception_message': str(e),
-            'traceback': traceback.format_exc()
+            'exception_message': str(e)
         }
-        st.session_state.webhook_responses.insert(0, error_data)
-        st.session_state.webhook_stats[webhook_type]['errors'] += 1
+        # Frame walking + formatting is expensive under error storms;
+        # capture the traceback only when advanced mode asks for it
+        if st.session_state.get('show_advanced'):
+            error_data['traceback'] = traceback.format_exc()
+        st.session_state.webhook_responses.appendleft(error_data)
+        stats['errors'] += 1
         log_webhook_error(webhook_type, e)
         return False, f"💥 Unexpected error: {str(e)[:100]}...", error_data
 
+def _record_response(webhook_type, url, payload_size, response):
+    """Map an HTTP response to (success, message, data) and record it
+    in session history/stats. Script thread only."""
+    response_data = {
+        'timestamp': datetime.now().isoformat(),
+        'webhook_type': webhook_type,
+        'status_code': response.status_code,
+        'success': response.status_code == 200,
+        'payload_size': payload_size,
+        'response_text': response.content[:500].decode('utf-8', 'replace') or None,
+        'url': url,
+        'attempt_count': 1,  # adapter-level retries are transparent
+        'validation_passed': True
+    }
+    st.session_state.webhook_responses.appendleft(response_data)
+
+    stats = st.session_state.webhook_stats[webhook_type]
+    if response.status_code == 200:
+        stats['success'] += 1
+        return True, f"✅ Successfully sent to {CONTENT_TYPES[webhook_type]['name']} webhook!", response_data
+
+    stats['errors'] += 1
+    if response.status_code == 429:
+        return False, "⚠️ Rate limited by server. Please try again later.", response_data
+    if response.status_code >= 500:
+        return False, f"🔧 Server error ({response.status_code}). Please try again later.", response_data
+    if response.status_code >= 400:
+        return False, f"❌ Request error ({response.status_code}): {response.content[:100].decode('utf-8', 'replace')}", response_data
+    return False, f"⚠️ Unexpected response ({response.status_code})", response_data
+
+def _post_one(task):
+    """Network-only POST for the fan-out worker threads: no
+    session_state access, just the request and a result tuple."""
+    webhook_type, url, body, headers = task
+    try:
+        _OUTBOUND_BUCKET.acquire()
+        response = _SESSION.post(url, data=body, headers=headers,
+                                 timeout=(5, 30), verify=True)
+        return webhook_type, url, response, None
+    except Exception as exc:
+        return webhook_type, url, None, exc
+
 def send_to_multiple_webhooks(payload, webhook_types):
-    """Send payload to multiple webhooks simultaneously with error handling"""
+    """Send payload to multiple webhooks concurrently with error handling.
+
+    Requests run in worker threads over the shared pooled session, so
+    wall-clock cost is the slowest endpoint rather than the sum; all
+    session_state bookkeeping stays on the script thread.
+    """
     results = {}
-    
+
     if not webhook_types:
         return {'error': 'No webhook types specified'}
-    
+
     # Validate payload once before sending to multiple webhooks
     try:
         is_valid, validation_errors = WebhookValidator.validate_webhook_payload(payload)
@@ -630,44 +847,80 @@ def send_to_multiple_webhooks(payload, webhook_types):
     except Exception as e:
         error_msg = f"Validation error: {str(e)}"
         return {webhook_type: {'success': False, 'message': error_msg, 'data': {'error': str(e)}} for webhook_type in webhook_types}
-    
-    # Send to each webhook
+
+    # Sanitize and serialize once: every worker posts the same encoded
+    # body instead of re-dumping the payload per endpoint
+    payload = WebhookValidator.sanitize_payload(payload)
+    body = _json_dumps(payload)
+    payload_size = len(body)
+    user_id = st.session_state.get('user_name', 'anonymous')
+    stats_map = st.session_state.webhook_stats
+
+    # Build the task list on the script thread (rate limits, headers,
+    # stats) so the workers only do network I/O
+    tasks = []
     for webhook_type in webhook_types:
-        try:
-            if webhook_type not in CONTENT_TYPES:
-                results[webhook_type] = {
-                    'success': False, 
-                    'message': f"Invalid webhook type: {webhook_type}", 
-                    'data': {'error': 'Invalid webhook type'}
-                }
-                continue
-            
-            success, message, data = send_to_webhook(payload, webhook_type)
-            results[webhook_type] = {'success': success, 'message': message, 'data': data}
-            
-        except Exception as e:
+        if webhook_type not in CONTENT_TYPES:
             results[webhook_type] = {
-                'success': False, 
-                'message': f"Error sending to {webhook_type}: {str(e)[:100]}...", 
-                'data': {'error': str(e), 'exception_type': type(e).__name__}
+                'success': False,
+                'message': f"Invalid webhook type: {webhook_type}",
+                'data': {'error': 'Invalid webhook type'}
             }
-            log_webhook_error(webhook_type, e)
-    
+            continue
+
+        rate_ok, rate_msg = rate_limiter.check_rate_limit(user_id, webhook_type)
+        if not rate_ok:
+            stats_map[webhook_type]['errors'] += 1
+            results[webhook_type] = {
+                'success': False,
+                'message': f"🚦 {rate_msg}",
+                'data': {'error': 'Rate limit exceeded', 'webhook_type': webhook_type}
+            }
+            continue
+
+        headers = {
+            **_BASE_HEADERS[webhook_type],
+            'X-Payload-Size': str(payload_size),
+            'X-User-ID': user_id
+        }
+        stats_map[webhook_type]['sent'] += 1
+        tasks.append((webhook_type, st.session_state.webhook_urls[webhook_type], body, headers))
+
+    if tasks:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(len(tasks), 10)) as pool:
+            outcomes = list(pool.map(_post_one, tasks))
+
+        for webhook_type, url, response, exc in outcomes:
+            if exc is not None:
+                error_data = {
+                    'error': type(exc).__name__,
+                    'timestamp': datetime.now().isoformat(),
+                    'webhook_type': webhook_type,
+                    'url': url,
+                    'exception_message': str(exc)
+                }
+                st.session_state.webhook_responses.appendleft(error_data)
+                stats_map[webhook_type]['errors'] += 1
+                log_webhook_error(webhook_type, exc)
+                results[webhook_type] = {
+                    'success': False,
+                    'message': f"Error sending to {webhook_type}: {str(exc)[:100]}...",
+                    'data': error_data
+                }
+            else:
+                success, message, data = _record_response(webhook_type, url, payload_size, response)
+                results[webhook_type] = {'success': success, 'message': message, 'data': data}
+
     return results
 
-def create_enhanced_voice_recorder():
-    """Create enhanced voice recorder with webhook type selection"""
-    webhook_type = st.session_state.selected_webhook_type
-    webhook_config = CONTENT_TYPES[webhook_type]
-    webhook_url = st.session_state.webhook_urls[webhook_type]
-    title = st.session_state.recording_title
-    description = st.session_state.recording_description
-    user_name = st.session_state.user_name
-    auto_send = st.session_state.auto_send
-    
-    recorder_html = f"""
+# Recorder HTML/JS compiled once at import: each rerun only
+# substitutes the handful of per-session values instead of rebuilding
+# and re-escaping the whole ~15KB f-string. JS template literals pass
+# through safe_substitute untouched.
+_RECORDER_TEMPLATE = string.Template("""
     <div id="voice-recorder-enhanced" style="
-        background: linear-gradient(135deg, {webhook_config['color']}, {webhook_config['color']}CC);
+        background: linear-gradient(135deg, ${color}, ${color}CC);
         padding: 30px;
         border-radius: 20px;
         margin: 20px 0;
@@ -677,10 +930,10 @@ def create_enhanced_voice_recorder():
     ">
         <div style="text-align: center; margin-bottom: 25px;">
             <h2 style="margin: 0 0 10px 0; font-size: 28px; font-weight: 700;">
-                {webhook_config['icon']} Enhanced Voice Recorder
+                ${icon} Enhanced Voice Recorder
             </h2>
             <p style="margin: 0; opacity: 0.9; font-size: 16px;">
-                Recording for {webhook_config['name']} - {webhook_config['description']}
+                Recording for ${name} - ${description}
             </p>
         </div>
         
@@ -694,12 +947,12 @@ def create_enhanced_voice_recorder():
         ">
             <div style="display: flex; align-items: center; justify-content: space-between; flex-wrap: wrap;">
                 <div>
-                    <strong>{webhook_config['icon']} Target:</strong> 
-                    <span style="font-family: monospace; font-size: 12px; opacity: 0.8;">{webhook_url[-30:]}...</span>
+                    <strong>${icon} Target:</strong> 
+                    <span style="font-family: monospace; font-size: 12px; opacity: 0.8;">${url_tail}...</span>
                 </div>
                 <div style="margin-top: 5px;">
                     <span style="background: rgba(76, 175, 80, 0.8); padding: 4px 12px; border-radius: 15px; font-size: 12px;">
-                        ✅ Auto-send: {'ON' if auto_send else 'OFF'}
+                        ✅ Auto-send: ${auto_send_badge}
                     </span>
                 </div>
             </div>
@@ -744,7 +997,7 @@ def create_enhanced_voice_recorder():
             font-weight: 600;
             margin: 20px 0;
             min-height: 30px;
-        ">{webhook_config['icon']} Ready to record for {webhook_config['name']}</div>
+        ">${icon} Ready to record for ${name}</div>
         
         <!-- Waveform Visualization -->
         <div id="waveformContainer" style="
@@ -757,13 +1010,11 @@ def create_enhanced_voice_recorder():
             height: 100px;
             overflow: hidden;
         ">
-            <div id="waveform" style="
-                display: flex;
-                align-items: end;
-                justify-content: center;
+            <canvas id="waveform" style="
+                display: block;
+                width: 100%;
                 height: 100%;
-                gap: 2px;
-            "></div>
+            "></canvas>
         </div>
         
         <!-- Recording Stats -->
@@ -831,12 +1082,21 @@ def create_enhanced_voice_recorder():
     <script>
     let mediaRecorder;
     let audioChunks = [];
+    let pendingChunkPosts = [];
+    let runningSize = 0;
+    let sizeTimer;
     let isRecording = false;
     let recordingTimer;
     let seconds = 0;
     let audioContext;
     let analyser;
-    let dataArray;
+    // One analyser buffer for the lifetime of the page: record/stop
+    // cycles reuse it instead of allocating a fresh Uint8Array each
+    // session
+    let dataArray = new Uint8Array(128);
+    let binCount = 32;
+    let meterNode = null;
+    let latestLevels = null;
     let animationId;
     let stream;
 
@@ -858,32 +1118,32 @@ def create_enhanced_voice_recorder():
     const fileSizeSpan = document.getElementById("fileSize");
     const qualitySpan = document.getElementById("quality");
 
-    function updateProgress(percent, text) {{
+    function updateProgress(percent, text) {
         progressContainer.style.display = 'block';
         progressBar.style.width = percent + '%';
         progressText.textContent = text;
         
-        if (percent >= 100) {{
-            setTimeout(() => {{
+        if (percent >= 100) {
+            setTimeout(() => {
                 progressContainer.style.display = 'none';
-            }}, 2000);
-        }}
-    }}
+            }, 2000);
+        }
+    }
 
-    function showWebhookStatus(message, isSuccess = true) {{
+    function showWebhookStatus(message, isSuccess = true) {
         webhookStatus.style.display = 'block';
         webhookStatus.textContent = message;
         webhookStatus.style.background = isSuccess 
             ? 'rgba(76, 175, 80, 0.8)' 
             : 'rgba(244, 67, 54, 0.8)';
         
-        setTimeout(() => {{
+        setTimeout(() => {
             webhookStatus.style.display = 'none';
-        }}, 5000);
-    }}
+        }, 5000);
+    }
 
-    function updateButtonStyles() {{
-        if (isRecording) {{
+    function updateButtonStyles() {
+        if (isRecording) {
             recordBtn.style.background = "linear-gradient(45deg, #666, #888)";
             recordBtn.style.cursor = "not-allowed";
             recordBtn.style.transform = "scale(0.95)";
@@ -893,7 +1153,7 @@ def create_enhanced_voice_recorder():
             stopBtn.style.cursor = "pointer";
             stopBtn.style.boxShadow = "0 8px 25px rgba(255, 71, 87, 0.5)";
             stopBtn.style.transform = "scale(1.05)";
-        }} else {{
+        } else {
             recordBtn.style.background = "linear-gradient(45deg, #ff6b6b, #ff8e8e)";
             recordBtn.style.cursor = "pointer";
             recordBtn.style.transform = "scale(1)";
@@ -903,138 +1163,262 @@ def create_enhanced_voice_recorder():
             stopBtn.style.cursor = "not-allowed";
             stopBtn.style.transform = "scale(0.95)";
             stopBtn.style.boxShadow = "0 4px 15px rgba(0,0,0,0.2)";
-        }}
-    }}
+        }
+    }
 
-    function startTimer() {{
+    function startTimer() {
         seconds = 0;
+        runningSize = 0;
         recordingStats.style.display = 'block';
-        recordingTimer = setInterval(() => {{
+        sizeTimer = setInterval(() => {
+            fileSizeSpan.textContent = formatFileSize(runningSize);
+        }, 2000);
+        recordingTimer = setInterval(() => {
             seconds++;
             const mins = Math.floor(seconds / 60);
             const secs = seconds % 60;
-            durationSpan.textContent = `${{mins.toString().padStart(2, '0')}}:${{secs.toString().padStart(2, '0')}}`;
-            statusDisplay.innerHTML = `🔴 Recording for {webhook_config['name']}... ${{mins}}:${{secs.toString().padStart(2, '0')}}`;
-        }}, 1000);
-    }}
+            durationSpan.textContent = `${mins.toString().padStart(2, '0')}:${secs.toString().padStart(2, '0')}`;
+            statusDisplay.innerHTML = `🔴 Recording for ${name}... ${mins}:${secs.toString().padStart(2, '0')}`;
+        }, 1000);
+    }
 
-    function stopTimer() {{
-        if (recordingTimer) {{
+    function stopTimer() {
+        if (recordingTimer) {
             clearInterval(recordingTimer);
             recordingTimer = null;
-        }}
-    }}
-
-    function createWaveform() {{
-        waveform.innerHTML = '';
-        for (let i = 0; i < 50; i++) {{
-            const bar = document.createElement('div');
-            bar.style.width = '3px';
-            bar.style.backgroundColor = 'rgba(255,255,255,0.7)';
-            bar.style.borderRadius = '2px';
-            bar.style.height = '10px';
-            bar.style.transition = 'height 0.1s ease';
-            waveform.appendChild(bar);
-        }}
-    }}
-
-    function animateWaveform() {{
-        if (!analyser || !isRecording) return;
-        
-        analyser.getByteFrequencyData(dataArray);
-        const bars = waveform.children;
-        
-        for (let i = 0; i < bars.length; i++) {{
-            const value = dataArray[i * 2] || 0;
-            const height = Math.max(10, (value / 255) * 80);
-            bars[i].style.height = height + 'px';
-        }}
-        
-        if (isRecording) {{
-            animationId = requestAnimationFrame(animateWaveform);
-        }}
-    }}
+        }
+        if (sizeTimer) {
+            clearInterval(sizeTimer);
+            sizeTimer = null;
+        }
+    }
+
+    const BAR_COUNT = 50;
+    const pendingHeights = new Uint8Array(BAR_COUNT);
+    let waveCtx = null;
+
+    function createWaveform() {
+        // One canvas instead of 50 animated divs: each frame is a
+        // single clearRect plus one fillRect per bar, with no per-bar
+        // style writes, layout or compositor layers to manage
+        waveform.width = waveform.clientWidth || 600;
+        waveform.height = waveform.clientHeight || 60;
+        waveCtx = waveform.getContext('2d');
+        waveCtx.fillStyle = 'rgba(255,255,255,0.7)';
+    }
+
+    let lastDraw = 0;
+
+    // Prefer an AudioWorklet meter: per-band RMS levels are computed
+    // from raw PCM on the audio thread and posted as a Float32Array,
+    // so the main thread never runs an FFT or analyser copy. Falls
+    // back to the AnalyserNode path where worklets are unavailable.
+    async function setupMeter(source) {
+        try {
+            const proc =
+                "class MeterProcessor extends AudioWorkletProcessor {" +
+                "  constructor() { super(); this.levels = new Float32Array(50); this.tick = 0; }" +
+                "  process(inputs) {" +
+                "    const ch = inputs[0][0];" +
+                "    if (ch) {" +
+                "      const bands = this.levels.length;" +
+                "      const win = Math.max(1, (ch.length / bands) | 0);" +
+                "      for (let b = 0; b < bands; b++) {" +
+                "        let sum = 0;" +
+                "        const start = b * win;" +
+                "        for (let j = 0; j < win; j++) { const s = ch[start + j] || 0; sum += s * s; }" +
+                "        this.levels[b] = Math.sqrt(sum / win);" +
+                "      }" +
+                "      if ((this.tick++ & 3) === 0) this.port.postMessage(this.levels);" +
+                "    }" +
+                "    return true;" +
+                "  }" +
+                "}" +
+                "registerProcessor('meter-processor', MeterProcessor);";
+            await audioContext.audioWorklet.addModule(
+                URL.createObjectURL(new Blob([proc], { type: 'application/javascript' })));
+            meterNode = new AudioWorkletNode(audioContext, 'meter-processor');
+            source.connect(meterNode);
+            meterNode.port.onmessage = (e) => { latestLevels = e.data; };
+            return true;
+        } catch (error) {
+            meterNode = null;
+            return false;
+        }
+    }
+
+    function animateWaveform() {
+        if (!isRecording || !waveCtx || (!analyser && !meterNode)) return;
+
+        // Hidden tab: stop the loop outright instead of queueing
+        // throttled frames; the visibilitychange listener restarts it
+        if (document.hidden) return;
+
+        animationId = requestAnimationFrame(animateWaveform);
+
+        // ~30fps is plenty for the meter; skipped frames cost nothing
+        // instead of an analyser copy plus 50 DOM writes at display rate
+        const now = performance.now();
+        if (now - lastDraw < 33) return;
+        lastDraw = now;
+
+        // Read/compute phase: heights computed into a local buffer
+        // with no DOM touched
+        if (meterNode) {
+            const levels = latestLevels;
+            for (let i = 0; i < BAR_COUNT; i++) {
+                const v = levels ? Math.min(255, (levels[i] * 512) | 0) : 0;
+                pendingHeights[i] = v < 32 ? 10 : (v * 80) >> 8;
+            }
+        } else {
+            analyser.getByteFrequencyData(dataArray);
+            for (let i = 0; i < BAR_COUNT; i++) {
+                const v = dataArray[i % binCount] | 0;
+                pendingHeights[i] = v < 32 ? 10 : (v * 80) >> 8;
+            }
+        }
+
+        // Write phase: one clear + fillRect sweep over the canvas;
+        // heights are 10..80 so scale them to the canvas height
+        const w = waveform.width;
+        const ch = waveform.height;
+        const step = w / BAR_COUNT;
+        const barW = Math.max(1, step - 2);
+        waveCtx.clearRect(0, 0, w, ch);
+        for (let i = 0; i < BAR_COUNT; i++) {
+            const bh = pendingHeights[i] * ch / 80;
+            waveCtx.fillRect(i * step, ch - bh, barW, bh);
+        }
+    }
 
-    async function startRecording() {{
-        try {{
+    async function startRecording() {
+        try {
             updateProgress(10, 'Requesting microphone access...');
             
-            stream = await navigator.mediaDevices.getUserMedia({{ 
-                audio: {{
+            stream = await navigator.mediaDevices.getUserMedia({ 
+                audio: {
                     echoCancellation: true,
                     noiseSuppression: true,
                     autoGainControl: true,
-                    sampleRate: 44100
-                }}
-            }});
+                    // Voice capture: 16kHz mono halves (twice) the PCM
+                    // pushed through the graph and encoder vs 44.1kHz
+                    sampleRate: 16000,
+                    channelCount: 1
+                }
+            });
             
             updateProgress(30, 'Setting up audio processing...');
             
             // Setup audio context for visualization
             audioContext = new (window.AudioContext || window.webkitAudioContext)();
-            analyser = audioContext.createAnalyser();
             const source = audioContext.createMediaStreamSource(stream);
-            source.connect(analyser);
-            
-            analyser.fftSize = 256;
-            const bufferLength = analyser.frequencyBinCount;
-            dataArray = new Uint8Array(bufferLength);
+            if (await setupMeter(source)) {
+                // Band levels come from the audio thread; no analyser
+                analyser = null;
+            } else {
+                analyser = audioContext.createAnalyser();
+                source.connect(analyser);
+                // 32 bins is all the 50-bar meter can show; a smaller
+                // FFT cuts both the audio-thread transform and the
+                // bytes copied out per frame
+                analyser.fftSize = 64;
+                binCount = analyser.frequencyBinCount;
+                if (binCount > dataArray.length) {
+                    dataArray = new Uint8Array(binCount);
+                }
+            }
             
             updateProgress(50, 'Initializing recorder...');
             
-            mediaRecorder = new MediaRecorder(stream, {{
-                mimeType: 'audio/webm;codecs=opus'
-            }});
+            mediaRecorder = new MediaRecorder(stream, {
+                mimeType: 'audio/webm;codecs=opus',
+                // Voice needs far less than the browser's default opus
+                // bitrate; smaller encode means smaller base64 payload
+                audioBitsPerSecond: ${audio_bitrate}
+            });
             
             audioChunks = [];
-            
-            mediaRecorder.ondataavailable = (event) => {{
-                if (event.data.size > 0) {{
+            pendingChunkPosts = [];
+
+            mediaRecorder.ondataavailable = (event) => {
+                if (event.data.size > 0) {
                     audioChunks.push(event.data);
-                    const currentSize = audioChunks.reduce((total, chunk) => total + chunk.size, 0);
-                    fileSizeSpan.textContent = formatFileSize(currentSize);
-                }}
-            }};
+                    runningSize += event.data.size;
+                    const worker = getEncoderWorker();
+                    if (worker) {
+                        // arrayBuffer() is async, so record the pending
+                        // post: onstop must not send 'finish' until
+                        // every chunk has actually reached the worker
+                        pendingChunkPosts.push(event.data.arrayBuffer().then(buf =>
+                            worker.postMessage({ type: 'chunk', buf: buf }, [buf])));
+                    }
+                }
+            };
             
-            mediaRecorder.onstop = async () => {{
+            mediaRecorder.onstop = async () => {
                 updateProgress(70, 'Processing recording...');
                 
-                const audioBlob = new Blob(audioChunks, {{ type: 'audio/webm' }});
+                const audioBlob = new Blob(audioChunks, { type: 'audio/webm' });
+                fileSizeSpan.textContent = formatFileSize(audioBlob.size);
                 const audioUrl = URL.createObjectURL(audioBlob);
                 playback.src = audioUrl;
                 playbackContainer.style.display = 'block';
                 
                 updateProgress(85, 'Converting to base64...');
-                
-                const reader = new FileReader();
-                reader.onload = () => {{
-                    const base64 = reader.result.split(',')[1];
-                    base64output.value = base64;
-                    
-                    updateProgress(100, 'Recording complete!');
-                    
-                    if ({str(auto_send).lower()}) {{
-                        showWebhookStatus('Auto-sending to {webhook_config["name"]} webhook...', true);
-                        setTimeout(() => {{
-                            const event = new Event('input', {{ bubbles: true }});
-                            base64output.dispatchEvent(event);
-                        }}, 1000);
-                    }} else {{
-                        showWebhookStatus('Recording ready. Use "Send to Webhook" button to send.', true);
-                    }}
-                }};
-                reader.readAsDataURL(audioBlob);
-                
+
                 // Cleanup
                 stream.getTracks().forEach(track => track.stop());
-                if (audioContext) {{
+                if (audioContext) {
                     audioContext.close();
-                }}
-            }};
+                }
+                meterNode = null;
+                latestLevels = null;
+
+                try {
+                    const worker = getEncoderWorker();
+                    if (worker) {
+                        // Without a timeslice the whole recording is one
+                        // chunk whose arrayBuffer() resolves after this
+                        // stop handler runs - wait for the posts to land
+                        // or 'finish' beats the audio to the worker
+                        await Promise.all(pendingChunkPosts);
+                        pendingChunkPosts = [];
+                        base64output.value = await new Promise((resolve, reject) => {
+                            worker.onmessage = (e) => resolve(e.data);
+                            worker.onerror = (e) => reject(new Error(e.message || 'encoder worker failed'));
+                            worker.postMessage({ type: 'finish' });
+                        });
+                    } else {
+                        base64output.value = await blobToBase64(audioBlob);
+                    }
+                } catch (error) {
+                    console.error('Error encoding recording:', error);
+                    showWebhookStatus('Error encoding recording: ' + error.message, false);
+                    updateProgress(0, '');
+                    return;
+                }
+
+                updateProgress(100, 'Recording complete!');
+
+                if (${auto_send_js}) {
+                    showWebhookStatus('Auto-sending to ${name} webhook...', true);
+                    setTimeout(() => {
+                        const event = new Event('input', { bubbles: true });
+                        base64output.dispatchEvent(event);
+                    }, 1000);
+                } else {
+                    showWebhookStatus('Recording ready. Use "Send to Webhook" button to send.', true);
+                }
+            };
+
+
             
             updateProgress(80, 'Starting recording...');
             
-            mediaRecorder.start(1000); // Collect data every second
+            // No timeslice: the UA keeps one blob (which it may back
+            // with a file) instead of handing us a chunk every second,
+            // so the JS heap stays flat however long the recording runs
+            mediaRecorder.start();
             isRecording = true;
             
             recordBtn.disabled = true;
@@ -1048,15 +1432,15 @@ def create_enhanced_voice_recorder():
             
             updateProgress(100, 'Recording in progress...');
             
-        }} catch (error) {{
+        } catch (error) {
             console.error('Error starting recording:', error);
             showWebhookStatus('Error: ' + error.message, false);
             updateProgress(0, '');
-        }}
-    }}
+        }
+    }
 
-    function stopRecording() {{
-        if (mediaRecorder && isRecording) {{
+    function stopRecording() {
+        if (mediaRecorder && isRecording) {
             mediaRecorder.stop();
             isRecording = false;
             
@@ -1066,32 +1450,136 @@ def create_enhanced_voice_recorder():
             
             stopTimer();
             
-            if (animationId) {{
+            if (animationId) {
                 cancelAnimationFrame(animationId);
-            }}
+            }
             
-            statusDisplay.innerHTML = '{webhook_config["icon"]} Recording completed for {webhook_config["name"]}';
-        }}
-    }}
+            statusDisplay.innerHTML = '${icon} Recording completed for ${name}';
+        }
+    }
+
+    // Encoding runs off the main thread: chunk buffers are handed to
+    // a dedicated worker as transferables (zero-copy) as they arrive,
+    // and at stop the worker sends back the finished base64 string.
+    // blobToBase64 below stays as the fallback when workers are
+    // unavailable in the embedding iframe.
+    let encoderWorker = null;
+    function getEncoderWorker() {
+        if (encoderWorker !== null) return encoderWorker;
+        const workerSrc =
+            "let buffers = [];" +
+            "self.onmessage = (e) => {" +
+            "  if (e.data.type === 'chunk') { buffers.push(new Uint8Array(e.data.buf)); return; }" +
+            "  let total = 0;" +
+            "  for (const b of buffers) total += b.length;" +
+            "  const all = new Uint8Array(total);" +
+            "  let off = 0;" +
+            "  for (const b of buffers) { all.set(b, off); off += b.length; }" +
+            "  buffers = [];" +
+            "  const parts = [];" +
+            "  for (let i = 0; i < all.length; i += 0x2FFFA) {" +
+            "    const sub = all.subarray(i, Math.min(i + 0x2FFFA, all.length));" +
+            "    let binary = '';" +
+            "    for (let j = 0; j < sub.length; j += 0x8000) {" +
+            "      binary += String.fromCharCode.apply(null, sub.subarray(j, Math.min(j + 0x8000, sub.length)));" +
+            "    }" +
+            "    parts.push(btoa(binary));" +
+            "  }" +
+            "  self.postMessage(parts.join(''));" +
+            "};";
+        try {
+            encoderWorker = new Worker(URL.createObjectURL(new Blob([workerSrc], { type: 'application/javascript' })));
+        } catch (error) {
+            encoderWorker = false;
+        }
+        return encoderWorker;
+    }
+
+    async function blobToBase64(blob) {
+        // Stream the blob and encode 3-byte-aligned chunks as they
+        // arrive: peak memory is one chunk plus the output instead of
+        // the blob AND its full data-URL string, and the UI thread
+        // yields between reads instead of blocking on one big encode
+        const reader = blob.stream().getReader();
+        const parts = [];
+        let carry = new Uint8Array(0);
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            let buf = value;
+            if (carry.length) {
+                buf = new Uint8Array(carry.length + value.length);
+                buf.set(carry, 0);
+                buf.set(value, carry.length);
+            }
+            const usable = buf.length - (buf.length % 3);
+            carry = buf.slice(usable);
+            let binary = '';
+            for (let i = 0; i < usable; i += 0x8000) {
+                binary += String.fromCharCode.apply(null, buf.subarray(i, Math.min(i + 0x8000, usable)));
+            }
+            if (binary) parts.push(btoa(binary));
+        }
+        if (carry.length) {
+            parts.push(btoa(String.fromCharCode.apply(null, carry)));
+        }
+        return parts.join('');
+    }
 
-    function formatFileSize(bytes) {{
+    function formatFileSize(bytes) {
         if (bytes === 0) return '0 B';
-        const k = 1024;
-        const sizes = ['B', 'KB', 'MB', 'GB'];
-        const i = Math.floor(Math.log(bytes) / Math.log(k));
-        return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
-    }}
+        // clz32 bit-length picks the 1024-unit without Math.log/pow
+        const i = bytes < 1024 ? 0 : Math.min(3, (31 - Math.clz32(bytes)) / 10 | 0);
+        return parseFloat((bytes / (1 << (i * 10))).toFixed(2)) + ' ' + ['B', 'KB', 'MB', 'GB'][i];
+    }
 
     // Event listeners
     recordBtn.addEventListener("click", startRecording);
     stopBtn.addEventListener("click", stopRecording);
+    document.addEventListener('visibilitychange', () => {
+        if (!document.hidden && isRecording) {
+            animateWaveform();
+        }
+    });
     
     // Initialize
     updateButtonStyles();
     </script>
+    """)
+
+# Opus bitrates per sidebar quality setting: voice stays intelligible
+# well below the browser default, and payload size scales with it
+_AUDIO_BITRATES = {'Low': 16000, 'Medium': 24000, 'High': 48000}
+
+@st.cache_data(show_spinner=False)
+def _build_recorder_html(webhook_type, url_tail, auto_send, audio_bitrate):
+    """Substitute the recorder template for one settings combination.
+
+    Cached on the primitive inputs: reruns with unchanged type/URL/
+    auto-send/quality reuse the rendered ~15KB document instead of
+    re-substituting it every script run.
     """
-    
-    return recorder_html
+    webhook_config = CONTENT_TYPES[webhook_type]
+    return _RECORDER_TEMPLATE.safe_substitute(
+        color=webhook_config['color'],
+        icon=webhook_config['icon'],
+        name=webhook_config['name'],
+        description=webhook_config['description'],
+        url_tail=url_tail,
+        auto_send_badge='ON' if auto_send else 'OFF',
+        auto_send_js=str(auto_send).lower(),
+        audio_bitrate=audio_bitrate
+    )
+
+def create_enhanced_voice_recorder():
+    """Create enhanced voice recorder with webhook type selection"""
+    webhook_type = st.session_state.selected_webhook_type
+    return _build_recorder_html(
+        webhook_type,
+        st.session_state.webhook_urls[webhook_type][-30:],
+        st.session_state.auto_send,
+        _AUDIO_BITRATES.get(st.session_state.audio_quality, 24000)
+    )
 
 def render_webhook_selector():
     """Render the webhook type selector"""
@@ -1101,20 +1589,12 @@ def render_webhook_selector():
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        # Create options for selectbox
-        options = []
-        for key, config in CONTENT_TYPES.items():
-            options.append(f"{config['icon']} {config['name']} - {config['description']}")
-        
-        selected_option = st.selectbox(
+        st.session_state.selected_webhook_type = st.selectbox(
             "Choose the type of content you're recording:",
-            options,
-            index=list(CONTENT_TYPES.keys()).index(st.session_state.selected_webhook_type)
+            _CT_KEYS,
+            index=_CT_KEYS.index(st.session_state.selected_webhook_type),
+            format_func=_CT_OPTION_LABELS.__getitem__
         )
-        
-        # Extract the key from the selected option
-        selected_key = list(CONTENT_TYPES.keys())[options.index(selected_option)]
-        st.session_state.selected_webhook_type = selected_key
     
     with col2:
         st.markdown("#### Batch Mode")
@@ -1123,9 +1603,9 @@ def render_webhook_selector():
         if st.session_state.batch_mode:
             st.session_state.selected_webhooks = st.multiselect(
                 "Select webhooks:",
-                list(CONTENT_TYPES.keys()),
+                _CT_KEYS,
                 default=st.session_state.selected_webhooks,
-                format_func=lambda x: f"{CONTENT_TYPES[x]['icon']} {CONTENT_TYPES[x]['name']}"
+                format_func=_CT_SHORT_LABELS.__getitem__
             )
     
     st.markdown('</div>', unsafe_allow_html=True)
@@ -1202,18 +1682,27 @@ def render_content_metadata_form():
     # Store updated metadata
     st.session_state.content_metadata[webhook_type] = metadata
 
+def _webhook_totals(stats):
+    """Aggregate sent/success/errors/active counts in one pass over the
+    per-type stats instead of a generator scan per metric."""
+    total_sent = total_success = total_errors = active = 0
+    for stat in stats.values():
+        total_sent += stat['sent']
+        total_success += stat['success']
+        total_errors += stat['errors']
+        active += stat['sent'] > 0
+    return total_sent, total_success, total_errors, active
+
 def render_webhook_stats():
     """Render webhook statistics"""
     st.markdown("### 📊 Webhook Statistics")
-    
+
     stats = st.session_state.webhook_stats
-    
+
     # Create metrics grid
     cols = st.columns(5)
-    
-    total_sent = sum(stat['sent'] for stat in stats.values())
-    total_success = sum(stat['success'] for stat in stats.values())
-    total_errors = sum(stat['errors'] for stat in stats.values())
+
+    total_sent, total_success, total_errors, active_webhooks = _webhook_totals(stats)
     success_rate = (total_success / total_sent * 100) if total_sent > 0 else 0
     
     with cols[0]:
@@ -1225,7 +1714,7 @@ def render_webhook_stats():
     with cols[3]:
         st.metric("Success Rate", f"{success_rate:.1f}%")
     with cols[4]:
-        st.metric("Active Webhooks", len([k for k, v in stats.items() if v['sent'] > 0]))
+        st.metric("Active Webhooks", active_webhooks)
     
     # Individual webhook stats
     st.markdown("#### Individual Webhook Performance")
@@ -1258,8 +1747,8 @@ def render_webhook_history():
     with col1:
         filter_type = st.selectbox(
             "Filter by type:",
-            ['All'] + list(CONTENT_TYPES.keys()),
-            format_func=lambda x: f"{CONTENT_TYPES[x]['icon']} {CONTENT_TYPES[x]['name']}" if x != 'All' else 'All Types'
+            ('All',) + _CT_KEYS,
+            format_func=lambda x: _CT_SHORT_LABELS.get(x, 'All Types')
         )
     
     with col2:
@@ -1271,20 +1760,40 @@ def render_webhook_history():
     with col3:
         show_details = st.checkbox("Show detailed errors", value=False)
     
-    # Filter responses
-    filtered_responses = st.session_state.webhook_responses
-    
-    if filter_type != 'All':
-        filtered_responses = [r for r in filtered_responses if r.get('webhook_type') == filter_type]
-    
-    if filter_status == 'Success':
-        filtered_responses = [r for r in filtered_responses if r.get('success', False)]
-    elif filter_status == 'Error':
-        filtered_responses = [r for r in filtered_responses if not r.get('success', True) and r.get('validation_passed', True)]
-    elif filter_status == 'Validation Failed':
-        filtered_responses = [r for r in filtered_responses if not r.get('validation_passed', True)]
-    
-    # Display responses
+    # Filter responses in a single pass, tallying the summary counts as we go
+    # instead of re-scanning the filtered list for each metric below
+    filtered_responses = []
+    successful = 0
+    validation_failed = 0
+    for r in st.session_state.webhook_responses:
+        if filter_type != 'All' and r.get('webhook_type') != filter_type:
+            continue
+        is_success = r.get('success', False)
+        is_validation_failed = not r.get('validation_passed', True)
+        if filter_status == 'Success':
+            if not is_success:
+                continue
+        elif filter_status == 'Error':
+            if r.get('success', True) or is_validation_failed:
+                continue
+        elif filter_status == 'Validation Failed':
+            if not is_validation_failed:
+                continue
+        filtered_responses.append(r)
+        successful += is_success
+        validation_failed += is_validation_failed
+    
+    # Display responses. Cards are accumulated and emitted as one
+    # st.markdown call instead of a container + markdown per response;
+    # the pending run is only flushed when an error expander has to be
+    # interleaved at the right position
+    card_parts = []
+
+    def _flush_cards():
+        if card_parts:
+            st.markdown(''.join(card_parts), unsafe_allow_html=True)
+            card_parts.clear()
+
     for i, response in enumerate(filtered_responses[:15]):  # Show last 15
         webhook_type = response.get('webhook_type', 'unknown')
         config = CONTENT_TYPES.get(webhook_type, {'icon': '❓', 'name': 'Unknown'})
@@ -1309,8 +1818,7 @@ def render_webhook_history():
             status_icon = "❌"
         
         # Main response card
-        with st.container():
-            st.markdown(f"""
+        card_parts.append(f"""
             <div style="
                 background: white;
                 padding: 15px;
@@ -1333,54 +1841,55 @@ def render_webhook_history():
                     Attempts: {response.get('attempt_count', 1)}
                 </div>
             </div>
-            """, unsafe_allow_html=True)
-            
-            # Show detailed error information if requested
-            if show_details and not response.get('success', False):
-                with st.expander(f"🔍 Error Details - {config['name']}", expanded=False):
-                    error_info = {}
-                    
-                    # Collect error information
-                    if 'validation_errors' in response:
-                        error_info['Validation Errors'] = response['validation_errors']
-                    if 'error' in response:
-                        error_info['Error Type'] = response['error']
-                    if 'exception_type' in response:
-                        error_info['Exception Type'] = response['exception_type']
-                    if 'exception_message' in response:
-                        error_info['Exception Message'] = response['exception_message']
-                    if 'response_text' in response and response['response_text']:
-                        error_info['Server Response'] = response['response_text']
-                    if 'connection_error' in response:
-                        error_info['Connection Error'] = response['connection_error']
-                    if 'ssl_error' in response:
-                        error_info['SSL Error'] = response['ssl_error']
-                    if 'json_error' in response:
-                        error_info['JSON Error'] = response['json_error']
-                    if 'url' in response:
-                        error_info['Target URL'] = response['url']
-                    
-                    # Display error information
-                    for key, value in error_info.items():
-                        if isinstance(value, list):
-                            st.write(f"**{key}:**")
-                            for item in value:
-                                st.write(f"  • {item}")
-                        else:
-                            st.write(f"**{key}:** {value}")
-                    
-                    # Show traceback if available (for debugging)
-                    if 'traceback' in response and st.checkbox(f"Show technical details", key=f"traceback_{i}"):
-                        st.code(response['traceback'], language='python')
-    
+            """)
+
+        # Show detailed error information if requested
+        if show_details and not response.get('success', False):
+            _flush_cards()
+            with st.expander(f"🔍 Error Details - {config['name']}", expanded=False):
+                error_info = {}
+
+                # Collect error information
+                if 'validation_errors' in response:
+                    error_info['Validation Errors'] = response['validation_errors']
+                if 'error' in response:
+                    error_info['Error Type'] = response['error']
+                if 'exception_type' in response:
+                    error_info['Exception Type'] = response['exception_type']
+                if 'exception_message' in response:
+                    error_info['Exception Message'] = response['exception_message']
+                if 'response_text' in response and response['response_text']:
+                    error_info['Server Response'] = response['response_text']
+                if 'connection_error' in response:
+                    error_info['Connection Error'] = response['connection_error']
+                if 'ssl_error' in response:
+                    error_info['SSL Error'] = response['ssl_error']
+                if 'json_error' in response:
+                    error_info['JSON Error'] = response['json_error']
+                if 'url' in response:
+                    error_info['Target URL'] = response['url']
+
+                # Display error information
+                for key, value in error_info.items():
+                    if isinstance(value, list):
+                        st.write(f"**{key}:**")
+                        for item in value:
+                            st.write(f"  • {item}")
+                    else:
+                        st.write(f"**{key}:** {value}")
+
+                # Show traceback if available (for debugging)
+                if 'traceback' in response and st.checkbox(f"Show technical details", key=f"traceback_{i}"):
+                    st.code(response['traceback'], language='python')
+
+    _flush_cards()
+
     # Summary statistics
     if filtered_responses:
         st.markdown("---")
         col1, col2, col3, col4 = st.columns(4)
         
         total_responses = len(filtered_responses)
-        successful = len([r for r in filtered_responses if r.get('success', False)])
-        validation_failed = len([r for r in filtered_responses if not r.get('validation_passed', True)])
         errors = total_responses - successful
         
         with col1:
@@ -1417,6 +1926,7 @@ def render_webhook_configuration():
 # Main application
 def main():
     initialize_session_state()
+    _drain_dispatch_results()
     
     # Header
     st.markdown("""
@@ -1456,9 +1966,8 @@ def main():
         
         # Quick stats
         st.markdown("### 📈 Quick Stats")
-        total_sent = sum(stat['sent'] for stat in st.session_state.webhook_stats.values())
-        total_success = sum(stat['success'] for stat in st.session_state.webhook_stats.values())
-        
+        total_sent, total_success, _, _ = _webhook_totals(st.session_state.webhook_stats)
+
         st.metric("Total Recordings", total_sent)
         st.metric("Successful Sends", total_success)
         
@@ -0,0 +1,35 @@
+"""Bake assets/style.css into an importable Python constant.
+
+Run from the app root after editing the stylesheet:
+
+    python scripts/bake_css.py
+
+Writes _css_blob.py next to app.py so load_css() can inject the styles
+from a constant string with zero file I/O at runtime. app.py falls back
+to reading the CSS file directly if the baked module is missing.
+"""
+
+import re
+from pathlib import Path
+
+APP_ROOT = Path(__file__).resolve().parent.parent
+CSS_FILE = APP_ROOT / "assets" / "style.css"
+OUT_FILE = APP_ROOT / "_css_blob.py"
+
+def minify(css: str) -> str:
+    """Strip comments and collapse whitespace (regex pass, not a full parser)"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,])\s*", r"\1", css)
+    return css.strip()
+
+def main():
+    css = minify(CSS_FILE.read_text())
+    OUT_FILE.write_text(
+        '"""Generated by scripts/bake_css.py - do not edit by hand."""\n\n'
+        f"CSS: str = {css!r}\n"
+    )
+    print(f"Baked {CSS_FILE} -> {OUT_FILE} ({len(css)} bytes)")
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,17 @@
 import streamlit as st
+import logging
 import os
 from datetime import datetime, timedelta
 
-def load_config():
-    """Load application configuration"""
-    config = {
+def setup_logging():
+    """Configure logging level from the APP_LOG_LEVEL env var"""
+    level = getattr(logging, os.getenv('APP_LOG_LEVEL', 'WARNING').upper(), logging.WARNING)
+    logging.basicConfig(level=level)
+
+@st.cache_resource
+def _build_config():
+    """Build the application configuration once per server process"""
+    return {
         'app_name': 'Business Management Suite',
         'version': '2.1.0',
         'debug': os.getenv('DEBUG', 'False').lower() == 'true',
@@ -13,11 +20,15 @@ def load_config():
         'allowed_file_types': ['json', 'csv', 'xlsx'],
         'theme': 'light'
     }
-    
+
+def load_config():
+    """Load application configuration"""
+    config = _build_config()
+
     # Store in session state
     if 'app_config' not in st.session_state:
         st.session_state.app_config = config
-    
+
     return config
 
 def get_config(key, default=None):
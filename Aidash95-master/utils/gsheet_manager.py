@@ -6,8 +6,17 @@ import time
 from datetime import datetime, timedelta
 import json
 import re
+from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+def _cell_value(v):
+    """Prepare one cell for a values write: numpy scalars become native
+    Python (gspread JSON-encodes the payload) and missing values become
+    empty cells instead of the literal string \"nan\"."""
+    if hasattr(v, "item"):
+        v = v.item()
+    return "" if pd.isna(v) else v
+
 class GoogleSheetsManager:
     """Centralized Google Sheets management with caching and error handling"""
     
@@ -18,6 +27,7 @@ class GoogleSheetsManager:
         ]
         self.cache_duration = 300  # 5 minutes
         self.max_retries = 3
+        self.disk_cache_dir = Path('.cache/sheets')
         
         # Initialize cache in session state
         if 'sheets_cache' not in st.session_state:
@@ -59,7 +69,45 @@ class GoogleSheetsManager:
         
         return sheet_url_or_id
     
-    def get_sheet_data(self, sheet_id: str, worksheet_name: Optional[str] = None, 
+    def _feather_path(self, cache_key: str) -> Path:
+        safe_key = re.sub(r'[^\w.-]', '_', cache_key)
+        return self.disk_cache_dir / f"{safe_key}.feather"
+
+    def _load_feather(self, cache_key: str) -> Optional[pd.DataFrame]:
+        """Load a frame from the on-disk Arrow cache if still fresh.
+
+        Survives page refreshes and process restarts, so a warm cache
+        replaces a 1-3 s Sheets round trip with a sub-100 ms mmap read.
+        """
+        try:
+            from pyarrow import feather
+        except ImportError:
+            return None
+
+        try:
+            path = self._feather_path(cache_key)
+            if not path.exists() or time.time() - path.stat().st_mtime >= self.cache_duration:
+                return None
+            return feather.read_table(str(path), memory_map=True).to_pandas(
+                split_blocks=True, self_destruct=True
+            )
+        except Exception:
+            return None  # disk cache is best-effort
+
+    def _store_feather(self, cache_key: str, df: pd.DataFrame):
+        """Persist a freshly loaded frame to the on-disk Arrow cache"""
+        try:
+            from pyarrow import feather
+        except ImportError:
+            return
+
+        try:
+            self.disk_cache_dir.mkdir(parents=True, exist_ok=True)
+            feather.write_feather(df, str(self._feather_path(cache_key)), compression='lz4')
+        except Exception:
+            pass  # disk cache is best-effort
+
+    def get_sheet_data(self, sheet_id: str, worksheet_name: Optional[str] = None,
                       use_cache: bool = True) -> Optional[pd.DataFrame]:
         """Get data from Google Sheet with caching"""
         try:
@@ -71,7 +119,18 @@ class GoogleSheetsManager:
                 cache_entry = st.session_state.sheets_cache[cache_key]
                 if time.time() - cache_entry['timestamp'] < self.cache_duration:
                     return cache_entry['data']
-            
+
+            # Session-cache miss: try the on-disk Arrow cache before
+            # paying for a Sheets API round trip
+            if use_cache:
+                df = self._load_feather(cache_key)
+                if df is not None:
+                    st.session_state.sheets_cache[cache_key] = {
+                        'data': df,
+                        'timestamp': time.time()
+                    }
+                    return df
+
             # Get fresh data
             client = self.get_client()
             if not client:
@@ -101,7 +160,8 @@ class GoogleSheetsManager:
                 'data': df,
                 'timestamp': time.time()
             }
-            
+            self._store_feather(cache_key, df)
+
             return df
             
         except gspread.SpreadsheetNotFound:
@@ -114,34 +174,41 @@ class GoogleSheetsManager:
             st.error(f"Error loading sheet data: {str(e)}")
             return None
     
-    def append_row(self, sheet_id: str, row_data: List[Any], 
-                   worksheet_name: Optional[str] = None) -> bool:
-        """Append a row to Google Sheet"""
+    def append_row(self, sheet_id: str, row_data: List[Any],
+                   worksheet_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Append a row to Google Sheet.
+
+        Returns the values.append API response (which includes
+        updates.updatedRange) so callers can update their in-memory
+        frame incrementally instead of re-downloading the sheet;
+        returns None on failure. The response dict is truthy, so
+        existing ``if append_row(...)`` call sites keep working.
+        """
         try:
             sheet_id = self.extract_sheet_id(sheet_id)
             client = self.get_client()
             if not client:
-                return False
-            
+                return None
+
             spreadsheet = client.open_by_key(sheet_id)
-            
+
             if worksheet_name:
                 worksheet = spreadsheet.worksheet(worksheet_name)
             else:
                 worksheet = spreadsheet.get_worksheet(0)
-            
-            worksheet.append_row(row_data)
-            
+
+            response = worksheet.append_row(row_data)
+
             # Clear cache for this sheet
             cache_key = f"{sheet_id}_{worksheet_name or 'default'}"
             if cache_key in st.session_state.sheets_cache:
                 del st.session_state.sheets_cache[cache_key]
-            
-            return True
-            
+
+            return response or {}
+
         except Exception as e:
             st.error(f"Error appending row: {str(e)}")
-            return False
+            return None
     
     def update_sheet_data(self, sheet_id: str, df: pd.DataFrame, 
                          worksheet_name: Optional[str] = None) -> bool:
@@ -176,20 +243,132 @@ class GoogleSheetsManager:
             st.error(f"Error updating sheet: {str(e)}")
             return False
     
+    def update_rows(self, sheet_id: str, row_updates: Dict[int, List[Any]],
+                    worksheet_name: Optional[str] = None) -> bool:
+        """Write only the given rows in one values batch update.
+
+        row_updates maps 0-based data-row positions (header excluded)
+        to full row value lists. Sending just the diff costs a single
+        API call sized by the edit, unlike clear() + full-sheet rewrite.
+        """
+        try:
+            sheet_id = self.extract_sheet_id(sheet_id)
+            client = self.get_client()
+            if not client:
+                return False
+
+            spreadsheet = client.open_by_key(sheet_id)
+
+            if worksheet_name:
+                worksheet = spreadsheet.worksheet(worksheet_name)
+            else:
+                worksheet = spreadsheet.get_worksheet(0)
+
+            # +2: one for the header row, one for 1-based sheet rows.
+            # Values go raw (not stringified) so numeric cells stay
+            # numbers in the sheet, matching the full-sheet write path
+            payload = [
+                {'range': f"A{pos + 2}", 'values': [[_cell_value(v) for v in row]]}
+                for pos, row in sorted(row_updates.items())
+            ]
+            worksheet.batch_update(payload)
+
+            cache_key = f"{sheet_id}_{worksheet_name or 'default'}"
+            if cache_key in st.session_state.sheets_cache:
+                del st.session_state.sheets_cache[cache_key]
+
+            return True
+
+        except Exception as e:
+            st.error(f"Error updating rows: {str(e)}")
+            return False
+
+    def get_worksheets_data_batch(self, sheet_id: str, worksheet_names: List[str],
+                                  use_cache: bool = True) -> Dict[str, pd.DataFrame]:
+        """Get several worksheets of one spreadsheet in a single API call.
+
+        Uses values_batch_get so K worksheet reads cost one HTTP round
+        trip instead of K, which matters for the per-minute read quota.
+        """
+        sheet_id = self.extract_sheet_id(sheet_id)
+        results = {}
+        pending = []
+
+        for name in worksheet_names:
+            cache_key = f"{sheet_id}_{name or 'default'}"
+            if use_cache and cache_key in st.session_state.sheets_cache:
+                cache_entry = st.session_state.sheets_cache[cache_key]
+                if time.time() - cache_entry['timestamp'] < self.cache_duration:
+                    results[name] = cache_entry['data']
+                    continue
+            pending.append(name)
+
+        if not pending:
+            return results
+
+        try:
+            client = self.get_client()
+            if not client:
+                return results
+
+            spreadsheet = client.open_by_key(sheet_id)
+            response = spreadsheet.values_batch_get([f"'{name}'" for name in pending])
+
+            for name, value_range in zip(pending, response.get('valueRanges', [])):
+                values = value_range.get('values', [])
+                if values:
+                    df = pd.DataFrame(values[1:], columns=values[0])
+                    df = df.dropna(how='all')
+                    df = df.loc[:, ~df.columns.str.contains('^Unnamed')]
+                else:
+                    df = pd.DataFrame()
+
+                results[name] = df
+                st.session_state.sheets_cache[f"{sheet_id}_{name or 'default'}"] = {
+                    'data': df,
+                    'timestamp': time.time()
+                }
+        except Exception as e:
+            st.error(f"Error batch-loading sheet data: {str(e)}")
+
+        return results
+
     def get_multiple_sheets_data(self, sheet_configs: List[Dict[str, str]]) -> Dict[str, pd.DataFrame]:
-        """Get data from multiple sheets efficiently"""
+        """Get data from multiple sheets efficiently.
+
+        Configs that target named worksheets of the same spreadsheet are
+        coalesced into one values_batch_get round trip; the rest go
+        through the regular cached single-sheet path.
+        """
         results = {}
-        
+        by_sheet: Dict[str, List[Dict[str, str]]] = {}
+        singles = []
+
         for config in sheet_configs:
-            sheet_id = config.get('sheet_id', '')
-            worksheet_name = config.get('worksheet_name')
-            key = config.get('key', sheet_id)
-            
-            if sheet_id:
-                df = self.get_sheet_data(sheet_id, worksheet_name)
+            sheet_id = self.extract_sheet_id(config.get('sheet_id', ''))
+            if not sheet_id:
+                continue
+            if config.get('worksheet_name'):
+                by_sheet.setdefault(sheet_id, []).append(config)
+            else:
+                singles.append((sheet_id, config))
+
+        for sheet_id, configs in by_sheet.items():
+            if len(configs) == 1:
+                singles.append((sheet_id, configs[0]))
+                continue
+            names = [config['worksheet_name'] for config in configs]
+            batch = self.get_worksheets_data_batch(sheet_id, names)
+            for config in configs:
+                df = batch.get(config['worksheet_name'])
                 if df is not None:
-                    results[key] = df
-        
+                    results[config.get('key', sheet_id)] = df
+
+        for sheet_id, config in singles:
+            df = self.get_sheet_data(sheet_id, config.get('worksheet_name'))
+            if df is not None:
+                results[config.get('key', sheet_id)] = df
+
         return results
     
     def clear_cache(self, sheet_id: Optional[str] = None):
@@ -199,8 +378,17 @@ class GoogleSheetsManager:
             keys_to_remove = [k for k in st.session_state.sheets_cache.keys() if k.startswith(sheet_id)]
             for key in keys_to_remove:
                 del st.session_state.sheets_cache[key]
+            prefix = re.sub(r'[^\w.-]', '_', sheet_id)
         else:
             st.session_state.sheets_cache.clear()
+            prefix = ''
+
+        # Drop matching on-disk Arrow cache entries as well
+        try:
+            for path in self.disk_cache_dir.glob(f"{prefix}*.feather"):
+                path.unlink()
+        except OSError:
+            pass
     
     def get_cache_info(self) -> Dict[str, Any]:
         """Get information about current cache"""